@@ -0,0 +1,84 @@
+"""content-addressed survey configs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def content_hash(value: object) -> str:
+    # Must match app.utils.hashing.content_hash
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.create_table(
+        "survey_configs",
+        sa.Column("hash", sa.String(length=64), nullable=False),
+        sa.Column("config", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column("surveys", sa.Column("config_hash", sa.String(length=64), nullable=True))
+
+    # Hash in Python so existing rows get the same keys the application computes
+    conn = op.get_bind()
+    surveys = conn.execute(sa.text("SELECT id, config FROM surveys")).all()
+    for survey_id, config in surveys:
+        config_hash = content_hash(config)
+        conn.execute(
+            sa.text(
+                "INSERT INTO survey_configs (hash, config) VALUES (:hash, CAST(:config AS JSONB)) "
+                "ON CONFLICT (hash) DO NOTHING"
+            ),
+            {"hash": config_hash, "config": json.dumps(config)},
+        )
+        conn.execute(
+            sa.text("UPDATE surveys SET config_hash = :hash WHERE id = :id"),
+            {"hash": config_hash, "id": survey_id},
+        )
+
+    op.alter_column("surveys", "config_hash", nullable=False)
+    op.create_foreign_key(
+        "fk_surveys_config_hash", "surveys", "survey_configs", ["config_hash"], ["hash"]
+    )
+    op.create_index("ix_surveys_config_hash", "surveys", ["config_hash"], unique=False)
+    op.drop_column("surveys", "config")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "surveys",
+        sa.Column("config", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        "UPDATE surveys SET config = survey_configs.config "
+        "FROM survey_configs WHERE survey_configs.hash = surveys.config_hash"
+    )
+    op.alter_column("surveys", "config", nullable=False)
+
+    op.drop_index("ix_surveys_config_hash", table_name="surveys")
+    op.drop_constraint("fk_surveys_config_hash", "surveys", type_="foreignkey")
+    op.drop_column("surveys", "config_hash")
+    op.drop_table("survey_configs")
@@ -0,0 +1,64 @@
+"""create response answers table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "response_answers",
+        sa.Column("response_id", sa.UUID(), nullable=False),
+        sa.Column("question_id", sa.String(length=100), nullable=False),
+        sa.Column("item", sa.SmallInteger(), nullable=False),
+        sa.Column("survey_id", sa.UUID(), nullable=False),
+        sa.Column("int_value", sa.Integer(), nullable=True),
+        sa.Column("text_value", sa.Text(), nullable=True),
+        sa.Column("option_index", sa.SmallInteger(), nullable=True),
+        sa.Column("choice_value", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("response_id", "question_id", "item"),
+        sa.ForeignKeyConstraint(["response_id"], ["responses.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_response_answers_option",
+        "response_answers",
+        ["survey_id", "question_id", "option_index"],
+        unique=False,
+        postgresql_where=sa.text("option_index IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_response_answers_int",
+        "response_answers",
+        ["survey_id", "question_id", "int_value"],
+        unique=False,
+        postgresql_where=sa.text("int_value IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_response_answers_text",
+        "response_answers",
+        ["text_value"],
+        unique=False,
+        postgresql_using="hash",
+        postgresql_where=sa.text("text_value IS NOT NULL"),
+    )
+    # Existing submissions are filled in by: python -m app.cli.backfill_answers
+
+
+def downgrade() -> None:
+    op.drop_index("ix_response_answers_text", table_name="response_answers")
+    op.drop_index("ix_response_answers_int", table_name="response_answers")
+    op.drop_index("ix_response_answers_option", table_name="response_answers")
+    op.drop_table("response_answers")
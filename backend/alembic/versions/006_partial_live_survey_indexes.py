@@ -0,0 +1,51 @@
+"""partial live survey indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The full index mostly held NULLs; live queries now use partial indexes
+    op.drop_index("ix_surveys_deleted_at", table_name="surveys")
+    op.create_index(
+        "ix_surveys_live_created_by",
+        "surveys",
+        ["created_by", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_surveys_live_window",
+        "surveys",
+        ["opens_at", "closes_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_surveys_deleted_at",
+        "surveys",
+        ["deleted_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_surveys_deleted_at", table_name="surveys")
+    op.drop_index("ix_surveys_live_window", table_name="surveys")
+    op.drop_index("ix_surveys_live_created_by", table_name="surveys")
+    op.create_index("ix_surveys_deleted_at", "surveys", ["deleted_at"], unique=False)
@@ -0,0 +1,123 @@
+"""partition responses by survey
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+DEFAULT_PARTITIONS = 16
+
+COLUMNS = "id, survey_id, user_id, answers, is_draft, submitted_at, created_at, updated_at"
+
+
+def response_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("survey_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "answers",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("is_draft", sa.Boolean(), nullable=False, server_default="true"),
+        sa.Column("submitted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    ]
+
+
+def add_response_foreign_keys() -> None:
+    op.create_foreign_key(
+        "responses_survey_id_fkey", "responses", "surveys", ["survey_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        "responses_user_id_fkey", "responses", "users", ["user_id"], ["id"], ondelete="CASCADE"
+    )
+
+
+def upgrade() -> None:
+    # `alembic -x response_partitions=32 upgrade head` to choose the count
+    partitions = int(context.get_x_argument(as_dictionary=True).get("response_partitions", DEFAULT_PARTITIONS))
+
+    # Build the partitioned table unconstrained, copy, then swap it in, so
+    # constraint and index names never clash with the old table's
+    op.create_table(
+        "responses_partitioned",
+        *response_columns(),
+        postgresql_partition_by="HASH (survey_id)",
+    )
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE responses_p{remainder:02d} PARTITION OF responses_partitioned "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+    op.execute(f"INSERT INTO responses_partitioned ({COLUMNS}) SELECT {COLUMNS} FROM responses")
+
+    op.drop_constraint("response_answers_response_id_fkey", "response_answers", type_="foreignkey")
+    op.drop_table("responses")
+    op.rename_table("responses_partitioned", "responses")
+
+    # Keys must include the partition column; uq_response_survey_user already does
+    op.create_primary_key("responses_pkey", "responses", ["id", "survey_id"])
+    op.create_unique_constraint("uq_response_survey_user", "responses", ["survey_id", "user_id"])
+    op.create_index("ix_responses_user_id", "responses", ["user_id"], unique=False)
+    add_response_foreign_keys()
+    op.create_foreign_key(
+        "response_answers_response_id_survey_id_fkey",
+        "response_answers",
+        "responses",
+        ["response_id", "survey_id"],
+        ["id", "survey_id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.create_table("responses_unpartitioned", *response_columns())
+    op.execute(f"INSERT INTO responses_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM responses")
+
+    op.drop_constraint(
+        "response_answers_response_id_survey_id_fkey", "response_answers", type_="foreignkey"
+    )
+    # Dropping the parent drops every partition
+    op.drop_table("responses")
+    op.rename_table("responses_unpartitioned", "responses")
+
+    op.create_primary_key("responses_pkey", "responses", ["id"])
+    op.create_unique_constraint("uq_response_survey_user", "responses", ["survey_id", "user_id"])
+    op.create_index("ix_responses_survey_id", "responses", ["survey_id"], unique=False)
+    op.create_index("ix_responses_user_id", "responses", ["user_id"], unique=False)
+    add_response_foreign_keys()
+    op.create_foreign_key(
+        "response_answers_response_id_fkey",
+        "response_answers",
+        "responses",
+        ["response_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,32 @@
+"""response answers hash and revision
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing rows keep a NULL hash; their next autosave is always written
+    op.add_column("responses", sa.Column("answers_hash", sa.String(length=64), nullable=True))
+    op.add_column(
+        "responses",
+        sa.Column("revision", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("responses", "revision")
+    op.drop_column("responses", "answers_hash")
@@ -0,0 +1,33 @@
+"""submitted responses index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Serves count(*) and max(submitted_at) of a survey's submissions
+    op.create_index(
+        "ix_responses_submitted",
+        "responses",
+        ["survey_id", "submitted_at"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_draft"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_responses_submitted", table_name="responses")
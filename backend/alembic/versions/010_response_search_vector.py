@@ -0,0 +1,36 @@
+"""response search vector
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("responses", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.create_index(
+        "ix_responses_search_vector",
+        "responses",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    # Existing responses are indexed by: python -m app.cli.backfill_search
+
+
+def downgrade() -> None:
+    op.drop_index("ix_responses_search_vector", table_name="responses")
+    op.drop_column("responses", "search_vector")
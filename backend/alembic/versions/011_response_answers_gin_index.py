@@ -0,0 +1,33 @@
+"""response answers gin index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @>, but is smaller and faster than the default
+    op.create_index(
+        "ix_responses_answers",
+        "responses",
+        ["answers"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"answers": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_responses_answers", table_name="responses")
@@ -0,0 +1 @@
+# Command-line utilities (run with python -m app.cli.<command>)
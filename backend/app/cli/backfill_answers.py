@@ -0,0 +1,96 @@
+"""
+Backfill the typed response_answers table for submitted responses.
+
+New submissions are written at submit time; this fills in responses that
+were submitted before the table existed or were bulk-loaded. Responses
+that already have typed rows are skipped, so the job can be re-run.
+
+Usage:
+    python -m app.cli.backfill_answers
+    python -m app.cli.backfill_answers --survey my-survey-slug --batch-size 5000
+"""
+
+import argparse
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import exists, select
+
+from app.database import BulkSessionLocal, bulk_engine
+from app.models.response import Response
+from app.models.response_answer import ResponseAnswer
+from app.models.survey import Survey
+from app.models.survey_config import SurveyConfig
+from app.services.answers import typed_answer_rows, write_typed_answers
+from app.services.questions import question_map
+
+
+async def backfill_survey(survey_id: UUID, config: dict[str, Any], batch_size: int) -> int:
+    """Write typed answers for one survey in batches; returns responses processed."""
+    questions = question_map(config)
+    processed = 0
+    last_id: UUID | None = None
+
+    while True:
+        stmt = (
+            select(Response.id, Response.answers)
+            .where(
+                Response.survey_id == survey_id,
+                Response.is_draft.is_(False),
+                ~exists().where(ResponseAnswer.response_id == Response.id),
+            )
+            .order_by(Response.id)
+            .limit(batch_size)
+        )
+        # Keyset pagination, so responses with no answerable items are not revisited
+        if last_id is not None:
+            stmt = stmt.where(Response.id > last_id)
+
+        async with BulkSessionLocal() as db:
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                return processed
+
+            await write_typed_answers(
+                db,
+                [
+                    answer
+                    for row in rows
+                    for answer in typed_answer_rows(questions, survey_id, row.id, row.answers)
+                ],
+            )
+            await db.commit()
+
+        processed += len(rows)
+        last_id = rows[-1].id
+
+
+async def main(args: argparse.Namespace) -> None:
+    stmt = (
+        select(Survey.id, Survey.slug, SurveyConfig.config)
+        .join(SurveyConfig, Survey.config_hash == SurveyConfig.hash)
+        .where(Survey.deleted_at.is_(None))
+    )
+    if args.survey:
+        stmt = stmt.where(Survey.slug == args.survey)
+
+    async with BulkSessionLocal() as db:
+        surveys = (await db.execute(stmt)).all()
+
+    for survey_id, slug, config in surveys:
+        processed = await backfill_survey(survey_id, config, args.batch_size)
+        print(f"{slug}: {processed} responses backfilled")
+
+    await bulk_engine.dispose()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", help="Only backfill the survey with this slug")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,82 @@
+"""
+Backfill the full-text search vector of responses.
+
+New and updated responses are indexed as they are saved; this fills in
+responses written before search existed or bulk-loaded. Only responses
+without a vector are touched, so the job can be re-run.
+
+Usage:
+    python -m app.cli.backfill_search
+    python -m app.cli.backfill_search --survey my-survey-slug --batch-size 5000
+"""
+
+import argparse
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from app.database import BulkSessionLocal, bulk_engine
+from app.models.response import Response
+from app.models.survey import Survey
+from app.models.survey_config import SurveyConfig
+from app.services.search import search_vector, searchable_text_expression
+
+
+async def backfill_survey(survey_id: UUID, config: dict[str, Any], batch_size: int) -> int:
+    """Index one survey's responses in set-based batches; returns responses indexed."""
+    pending = (
+        select(Response.id)
+        .where(Response.survey_id == survey_id, Response.search_vector.is_(None))
+        .limit(batch_size)
+    )
+    stmt = (
+        update(Response)
+        .where(Response.survey_id == survey_id, Response.id.in_(pending))
+        # Keep updated_at: indexing is not a change to the response
+        .values(
+            search_vector=search_vector(searchable_text_expression(config)),
+            updated_at=Response.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    indexed = 0
+    while True:
+        async with BulkSessionLocal() as db:
+            result = await db.execute(stmt)
+            await db.commit()
+        indexed += result.rowcount
+        if result.rowcount < batch_size:
+            return indexed
+
+
+async def main(args: argparse.Namespace) -> None:
+    stmt = (
+        select(Survey.id, Survey.slug, SurveyConfig.config)
+        .join(SurveyConfig, Survey.config_hash == SurveyConfig.hash)
+        .where(Survey.deleted_at.is_(None))
+    )
+    if args.survey:
+        stmt = stmt.where(Survey.slug == args.survey)
+
+    async with BulkSessionLocal() as db:
+        surveys = (await db.execute(stmt)).all()
+
+    for survey_id, slug, config in surveys:
+        indexed = await backfill_survey(survey_id, config, args.batch_size)
+        print(f"{slug}: {indexed} responses indexed")
+
+    await bulk_engine.dispose()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", help="Only backfill the survey with this slug")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -6,6 +8,23 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Separate pools, so admin and export work cannot starve respondents of
+    # connections. The DB_POOL_* settings size the respondent pool; each pool
+    # aborts statements after its timeout in milliseconds (0: no limit).
+    DB_STATEMENT_TIMEOUT_MS: int = 5_000
+    DB_ADMIN_POOL_SIZE: int = 3
+    DB_ADMIN_MAX_OVERFLOW: int = 2
+    DB_ADMIN_STATEMENT_TIMEOUT_MS: int = 30_000
+    DB_BULK_POOL_SIZE: int = 3
+    DB_BULK_MAX_OVERFLOW: int = 0
+    DB_BULK_STATEMENT_TIMEOUT_MS: int = 300_000
+    # Pool connections opened and primed with the hot statements at startup
+    DB_WARMUP_CONNECTIONS: int = 5
+    # Hash partitions of the responses table when created by metadata.create_all;
+    # migrations take it as `alembic -x response_partitions=N upgrade head`
+    RESPONSE_PARTITIONS: int = 16
 
     # GitHub OAuth
     GITHUB_CLIENT_ID: str
@@ -21,6 +40,35 @@ class Settings(BaseSettings):
     # Frontend URL (for CORS and redirects)
     FRONTEND_URL: str
 
+    # Token-bucket limit on draft autosaves, per user and survey.
+    # "postgres" shares buckets across workers; final submissions are never limited.
+    # Postgres buckets that have refilled are deleted by the survey purger.
+    RESPOND_RATE_LIMIT_BACKEND: Literal["memory", "postgres", "off"] = "memory"
+    RESPOND_RATE_LIMIT_CAPACITY: int = 10
+    RESPOND_RATE_LIMIT_REFILL_PER_SECOND: float = 1.0
+
+    # Slugs cached per worker for the respondent paths, invalidated via NOTIFY; 0 disables
+    SURVEY_CACHE_SIZE: int = 10_000
+
+    # Encode list endpoints with orjson, skipping response_model validation
+    FAST_JSON_RESPONSES: bool = False
+
+    # Soft-deleted surveys are hard-deleted after the retention period by a
+    # background task; responses are removed in batches. 0 disables the task.
+    SURVEY_PURGE_RETENTION_DAYS: int = 30
+    SURVEY_PURGE_INTERVAL_SECONDS: int = 3600
+    SURVEY_PURGE_BATCH_SIZE: int = 1000
+
+    # Exports encoded at once on the export thread pool, and further exports
+    # that may wait for a slot before new ones are refused with 503
+    EXPORT_WORKERS: int = 2
+    EXPORT_QUEUE_SIZE: int = 8
+
+    # Event-loop lag sampling period (0 disables the monitor), and how long the
+    # loop may be blocked before the stack and request are logged (0 disables)
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.25
+    LOOP_BLOCK_THRESHOLD_SECONDS: float = 0.2
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -1,18 +1,73 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+def create_pool(pool_size: int, max_overflow: int, statement_timeout_ms: int) -> AsyncEngine:
+    """An engine with its own pool, aborting statements that run past the timeout (0: none)."""
+    return create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args={"server_settings": {"statement_timeout": str(statement_timeout_ms)}},
+    )
+
+
+# Respondent traffic: sign-in, survey pages and autosaves
+engine = create_pool(
+    settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW, settings.DB_STATEMENT_TIMEOUT_MS
+)
+# Admin dashboard reads and edits
+admin_engine = create_pool(
+    settings.DB_ADMIN_POOL_SIZE,
+    settings.DB_ADMIN_MAX_OVERFLOW,
+    settings.DB_ADMIN_STATEMENT_TIMEOUT_MS,
+)
+# Exports, bulk operations and background maintenance
+bulk_engine = create_pool(
+    settings.DB_BULK_POOL_SIZE,
+    settings.DB_BULK_MAX_OVERFLOW,
+    settings.DB_BULK_STATEMENT_TIMEOUT_MS,
+)
+engines = (engine, admin_engine, bulk_engine)
+
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
+AdminSessionLocal = sessionmaker(
+    admin_engine, class_=AsyncSession, expire_on_commit=False
+)
+BulkSessionLocal = sessionmaker(
+    bulk_engine, class_=AsyncSession, expire_on_commit=False
+)
 Base = declarative_base()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides an async database session."""
+    """Dependency that provides an async database session (respondent pool)."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_admin_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides a session from the admin pool."""
+    async with AdminSessionLocal() as session:
+        yield session
+
+
+async def get_bulk_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides a session from the bulk/export pool."""
+    async with BulkSessionLocal() as session:
+        yield session
+
+
+def get_bulk_session_factory() -> Callable[[], AsyncSession]:
+    """
+    Dependency that provides the bulk pool's session factory, for streamed
+    bodies that open their own sessions after the request's is released.
+    """
+    return BulkSessionLocal
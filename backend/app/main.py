@@ -1,12 +1,68 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+import asyncpg
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
+from app.database import engines
+from app.services.loop_monitor import RouteTrackingMiddleware, loop_monitor
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start the loop-lag monitor, warm the worker before it accepts traffic,
+    run the soft-delete purger in the background, and release the pools on
+    shutdown.
+    """
+    from app.services.export_executor import export_executor
+    from app.services.notifications import pg_listener
+    from app.services.purge import run_purger
+    from app.services.warmup import warm_up_database
+
+    if settings.LOOP_MONITOR_INTERVAL_SECONDS > 0:
+        loop_monitor.start()
+
+    app.state.ready = False
+    try:
+        await warm_up_database()
+    except (OSError, SQLAlchemyError, asyncpg.PostgresError):
+        # Still marked ready: /health/ready checks the database on every probe
+        logger.error(
+            "Database warm-up failed; serving without primed connections or survey cache",
+            exc_info=True,
+        )
+    app.state.ready = True
+
+    purger = None
+    if settings.SURVEY_PURGE_INTERVAL_SECONDS > 0:
+        purger = asyncio.create_task(run_purger(settings.SURVEY_PURGE_INTERVAL_SECONDS))
+
+    yield
+
+    if purger is not None:
+        purger.cancel()
+        with suppress(asyncio.CancelledError):
+            await purger
+    await loop_monitor.stop()
+    export_executor.shutdown()
+    await pg_listener.close()
+    for engine in engines:
+        await engine.dispose()
+
 
 app = FastAPI(
     title="SurveyFlow API",
     description="Backend API for the SurveyFlow survey platform",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -17,12 +73,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Labels requests for the loop monitor's blocked-loop reports
+app.add_middleware(RouteTrackingMiddleware)
 
 # Register routers
-from app.routers import auth, health, responses, surveys
+from app.routers import auth, health, me, responses, surveys
 
 app.include_router(health.router, prefix="/api/v1")
 app.include_router(auth.router, prefix="/api/v1")
+app.include_router(me.router, prefix="/api/v1")
 # responses router must come before surveys to handle /surveys/active before /surveys/{survey_id}
 app.include_router(responses.router, prefix="/api/v1")
 app.include_router(surveys.router, prefix="/api/v1")
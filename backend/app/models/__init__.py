@@ -1,6 +1,9 @@
 # Database models
 from app.models.user import User
 from app.models.survey import Survey
+from app.models.survey_config import SurveyConfig
 from app.models.response import Response
+from app.models.response_answer import ResponseAnswer
+from app.models.rate_limit import RateLimitBucket
 
-__all__ = ["User", "Survey", "Response"]
+__all__ = ["User", "Survey", "SurveyConfig", "Response", "ResponseAnswer", "RateLimitBucket"]
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Float, String
+
+from app.database import Base
+
+
+class RateLimitBucket(Base):
+    """Token bucket state shared by all workers (Postgres rate-limit backend)."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket {self.key}>"
@@ -1,27 +1,63 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
+from app.config import settings
 from app.database import Base
 
 
 class Response(Base):
-    """Response model representing a user's answers to a survey."""
+    """
+    Response model representing a user's answers to a survey.
+
+    The table is hash-partitioned on survey_id, so per-survey queries touch
+    a single partition. Keys of a partitioned table must include the
+    partition column, hence the (id, survey_id) primary key.
+    """
 
     __tablename__ = "responses"
     __table_args__ = (
+        # Also serves survey_id lookups, so there is no separate survey_id index
         UniqueConstraint("survey_id", "user_id", name="uq_response_survey_user"),
+        Index("ix_responses_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves answers @> '{...}' containment filters
+        Index(
+            "ix_responses_answers",
+            "answers",
+            postgresql_using="gin",
+            postgresql_ops={"answers": "jsonb_path_ops"},
+        ),
+        # Submission counts and latest submission per survey, e.g. the crosstab
+        # cache stamp, read from the index alone
+        Index(
+            "ix_responses_submitted",
+            "survey_id",
+            "submitted_at",
+            postgresql_where=text("NOT is_draft"),
+        ),
+        {"postgresql_partition_by": "HASH (survey_id)"},
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     survey_id = Column(
         UUID(as_uuid=True),
         ForeignKey("surveys.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     user_id = Column(
         UUID(as_uuid=True),
@@ -30,6 +66,12 @@ class Response(Base):
         index=True,
     )
     answers = Column(JSONB, nullable=False, default=dict)
+    # Content hash of answers, to recognise autosaves that change nothing
+    answers_hash = Column(String(64), nullable=True)
+    # Incremented on every write; clients send it back to detect stale writes
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
+    # Free-text answers (per the survey config) for full-text search
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
     is_draft = Column(Boolean, nullable=False, default=True)
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
@@ -47,3 +89,17 @@ class Response(Base):
 
     def __repr__(self) -> str:
         return f"<Response survey={self.survey_id} user={self.user_id}>"
+
+
+def response_partition_ddl(partitions: int) -> list[str]:
+    """CREATE TABLE statements for the hash partitions of responses."""
+    return [
+        f"CREATE TABLE responses_p{remainder:02d} PARTITION OF responses "
+        f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        for remainder in range(partitions)
+    ]
+
+
+# metadata.create_all (tests, benchmarks) builds the partitions; migrations create their own
+for statement in response_partition_ddl(settings.RESPONSE_PARTITIONS):
+    event.listen(Response.__table__, "after_create", DDL(statement))
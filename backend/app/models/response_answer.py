@@ -0,0 +1,56 @@
+from sqlalchemy import Column, ForeignKeyConstraint, Index, Integer, SmallInteger, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class ResponseAnswer(Base):
+    """
+    One answered item of a submitted response, typed for analytics queries.
+    Multi-select answers produce one row per selected option (item 0..n).
+    Choices are stored as option_index, or as choice_value when they are not
+    among the question's options; text_value only holds free text.
+    """
+
+    __tablename__ = "response_answers"
+    __table_args__ = (
+        # responses is partitioned, so its key includes survey_id
+        ForeignKeyConstraint(
+            ["response_id", "survey_id"],
+            ["responses.id", "responses.survey_id"],
+            ondelete="CASCADE",
+        ),
+        Index(
+            "ix_response_answers_option",
+            "survey_id",
+            "question_id",
+            "option_index",
+            postgresql_where=text("option_index IS NOT NULL"),
+        ),
+        Index(
+            "ix_response_answers_int",
+            "survey_id",
+            "question_id",
+            "int_value",
+            postgresql_where=text("int_value IS NOT NULL"),
+        ),
+        # Equality lookups on free text; hash indexes have no key size limit
+        Index(
+            "ix_response_answers_text",
+            "text_value",
+            postgresql_using="hash",
+            postgresql_where=text("text_value IS NOT NULL"),
+        ),
+    )
+
+    response_id = Column(UUID(as_uuid=True), primary_key=True)
+    question_id = Column(String(100), primary_key=True)
+    item = Column(SmallInteger, primary_key=True, default=0)
+    survey_id = Column(UUID(as_uuid=True), nullable=False)
+    int_value = Column(Integer, nullable=True)
+    text_value = Column(Text, nullable=True)
+    option_index = Column(SmallInteger, nullable=True)
+    choice_value = Column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ResponseAnswer response={self.response_id} question={self.question_id}>"
@@ -1,8 +1,8 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,18 +12,41 @@ class Survey(Base):
     """Survey model representing a survey created by an admin."""
 
     __tablename__ = "surveys"
+    __table_args__ = (
+        # Hot queries only ever read live surveys; deleted rows stay out of these
+        Index(
+            "ix_surveys_live_created_by",
+            "created_by",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_surveys_live_window",
+            "opens_at",
+            "closes_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Soft-deleted surveys, scanned by the purger
+        Index(
+            "ix_surveys_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     slug = Column(String(255), unique=True, nullable=False, index=True)
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
-    config = Column(JSONB, nullable=False)
+    config_hash = Column(
+        String(64), ForeignKey("survey_configs.hash"), nullable=False, index=True
+    )
     created_by = Column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
     )
     opens_at = Column(DateTime(timezone=True), nullable=True)
     closes_at = Column(DateTime(timezone=True), nullable=True)
-    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
     )
@@ -35,9 +58,16 @@ class Survey(Base):
     )
 
     creator = relationship("User", back_populates="surveys")
+    # Configs can be large; load explicitly with joinedload(Survey.config_document)
+    config_document = relationship("SurveyConfig", lazy="raise", innerjoin=True)
     responses = relationship(
         "Response", back_populates="survey", cascade="all, delete-orphan"
     )
 
+    @property
+    def config(self) -> dict:
+        """The survey's JSON configuration, shared with every copy of the survey."""
+        return self.config_document.config
+
     def __repr__(self) -> str:
         return f"<Survey {self.slug}>"
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database import Base
+
+
+class SurveyConfig(Base):
+    """Survey configuration document, stored once and addressed by its content hash."""
+
+    __tablename__ = "survey_configs"
+
+    hash = Column(String(64), primary_key=True)
+    config = Column(JSONB, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<SurveyConfig {self.hash[:12]}>"
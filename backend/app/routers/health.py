@@ -1,4 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import engine
+from app.models.user import User
+from app.services.loop_monitor import loop_monitor
+from app.utils.security import get_current_admin
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -7,6 +15,35 @@ router = APIRouter(prefix="/health", tags=["health"])
 async def health_check() -> dict[str, str]:
     """
     T037: Health check endpoint for monitoring and deployment verification.
-    Returns a simple status indicating the service is running.
+    Returns a simple status indicating the service is running (liveness).
     """
     return {"status": "healthy"}
+
+
+@router.get("/ready", response_model=None)
+async def readiness_check(request: Request) -> dict[str, str] | JSONResponse:
+    """
+    Readiness check: succeeds once startup warm-up has finished and the
+    database is reachable. Returns 503 otherwise so no traffic is routed
+    to a cold or disconnected worker.
+    """
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "starting"}, status_code=503)
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, SQLAlchemyError):
+        return JSONResponse({"status": "database_unavailable"}, status_code=503)
+
+    return {"status": "ready"}
+
+
+@router.get("/loop")
+async def loop_lag(admin: User = Depends(get_current_admin)) -> dict:
+    """
+    Event-loop scheduling delay on this worker: recent lag percentiles and
+    how many times the loop was blocked past the reporting threshold.
+    Admin only, unlike the probes above.
+    """
+    return loop_monitor.snapshot()
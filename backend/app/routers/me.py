@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import Select, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.response import Response
+from app.models.survey import Survey
+from app.models.user import User
+from app.schemas.response import MyResponseListItem
+from app.utils.security import get_current_user
+from app.utils.serialization import rows_response
+
+router = APIRouter(prefix="/me", tags=["me"])
+
+
+def my_responses_statement(user_id: UUID, include_answers: bool) -> Select:
+    """The user's responses on live surveys, most recently updated first."""
+    columns = [
+        Response.survey_id,
+        Survey.slug,
+        Survey.title,
+        Response.is_draft,
+        Response.submitted_at,
+        Response.updated_at,
+    ]
+    # Always present, so the fast path renders the same keys as the schema
+    columns.append(Response.answers if include_answers else null().label("answers"))
+
+    return (
+        select(*columns)
+        .join(Survey, Response.survey_id == Survey.id)
+        .where(Response.user_id == user_id, Survey.deleted_at.is_(None))
+        .order_by(Response.updated_at.desc())
+    )
+
+
+@router.get("/responses", response_model=list[MyResponseListItem])
+async def list_my_responses(
+    include_answers: bool = Query(False, description="Include each response's answers"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> list[MyResponseListItem]:
+    """
+    List the current user's draft and submitted responses across all
+    surveys in a single query.
+    """
+    result = await db.execute(my_responses_statement(current_user.id, include_answers))
+    return rows_response([dict(row) for row in result.mappings()])
@@ -1,8 +1,13 @@
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import or_, select
+import math
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import Response as HTTPResponse
+from sqlalchemy import Insert, Select, and_, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.database import get_db
 from app.models.response import Response
@@ -10,17 +15,85 @@ from app.models.survey import Survey
 from app.models.user import User
 from app.schemas.response import MyResponseResponse, ResponseCreate, ResponseResponse
 from app.schemas.survey import SurveyPublicResponse
+from app.services.answers import typed_answer_rows, write_typed_answers
+from app.services.live import notify_statement, response_event
+from app.services.questions import question_map
+from app.services.rate_limit import respond_rate_limiter
+from app.services.search import search_vector, searchable_text
+from app.services.survey_cache import CachedSurvey, survey_cache
+from app.utils.hashing import content_hash
 from app.utils.security import get_current_user
+from app.utils.serialization import rows_response
 
 router = APIRouter(prefix="/surveys", tags=["responses"])
 
 
-async def get_survey_by_slug(db: AsyncSession, slug: str) -> Survey:
-    """Get a survey by slug, verifying it exists and is not deleted."""
-    result = await db.execute(
-        select(Survey).where(Survey.slug == slug, Survey.deleted_at.is_(None))
+def response_upsert_statement(
+    survey_id: UUID,
+    user_id: UUID,
+    answers: dict,
+    is_draft: bool,
+    expected_revision: int | None = None,
+    search_text: str = "",
+) -> Insert:
+    """
+    Create or update a user's response in a single round-trip.
+
+    The existing row is left untouched, and the statement returns no row,
+    when it was already submitted, when a draft save would not change the
+    answers, or when `expected_revision` is given and is not current.
+    """
+    now = datetime.utcnow()
+    stmt = pg_insert(Response).values(
+        survey_id=survey_id,
+        user_id=user_id,
+        answers=answers,
+        answers_hash=content_hash(answers),
+        is_draft=is_draft,
+        revision=1,
+        search_vector=search_vector(search_text),
+        submitted_at=None if is_draft else now,
+        created_at=now,
+        updated_at=now,
+    )
+
+    conditions = [
+        Response.is_draft.is_(True),
+        # Skip rewriting an identical draft: no dead tuple, no WAL
+        or_(
+            stmt.excluded.is_draft.is_(False),
+            Response.answers_hash.is_distinct_from(stmt.excluded.answers_hash),
+        ),
+    ]
+    if expected_revision is not None:
+        conditions.append(Response.revision == expected_revision)
+
+    return stmt.on_conflict_do_update(
+        index_elements=[Response.survey_id, Response.user_id],
+        set_={
+            "answers": stmt.excluded.answers,
+            "answers_hash": stmt.excluded.answers_hash,
+            "is_draft": stmt.excluded.is_draft,
+            "revision": Response.revision + 1,
+            "search_vector": stmt.excluded.search_vector,
+            "submitted_at": stmt.excluded.submitted_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=and_(*conditions),
+    ).returning(Response)
+
+
+def user_response_statement(survey_id: UUID, user_id: UUID) -> Select:
+    """A user's response to a survey."""
+    return select(Response).where(
+        Response.survey_id == survey_id,
+        Response.user_id == user_id,
     )
-    survey = result.scalar_one_or_none()
+
+
+async def get_survey_by_slug(db: AsyncSession, slug: str) -> CachedSurvey:
+    """Get a survey by slug, verifying it exists and is not deleted."""
+    survey = await survey_cache.get(db, slug)
 
     if survey is None:
         raise HTTPException(
@@ -31,9 +104,10 @@ async def get_survey_by_slug(db: AsyncSession, slug: str) -> Survey:
     return survey
 
 
-def is_survey_open(survey: Survey) -> bool:
+def is_survey_open(survey: CachedSurvey) -> bool:
     """Check if a survey is currently accepting responses."""
-    now = datetime.utcnow()
+    # Stored timestamps are timezone-aware
+    now = datetime.now(timezone.utc)
 
     if survey.opens_at and now < survey.opens_at:
         return False
@@ -63,7 +137,9 @@ async def get_active_surveys(
     )
 
     result = await db.execute(
-        select(Survey).where(
+        select(Survey)
+        .options(joinedload(Survey.config_document))
+        .where(
             Survey.deleted_at.is_(None),
             or_(Survey.opens_at.is_(None), Survey.opens_at <= now),
             or_(Survey.closes_at.is_(None), Survey.closes_at > now),
@@ -73,36 +149,54 @@ async def get_active_surveys(
     )
     surveys = result.scalars().all()
 
-    return [
-        SurveyPublicResponse(
-            slug=s.slug,
-            title=s.title,
-            description=s.description,
-            config=s.config,
-            opens_at=s.opens_at,
-            closes_at=s.closes_at,
-            is_open=True,
-        )
+    return rows_response([
+        {
+            "slug": s.slug,
+            "title": s.title,
+            "description": s.description,
+            "config": s.config,
+            "opens_at": s.opens_at,
+            "closes_at": s.closes_at,
+            "is_open": True,
+        }
         for s in surveys
-    ]
+    ])
+
+
+def public_survey_etag(config_hash: str, updated_at: datetime, is_open: bool) -> str:
+    """
+    ETag for the public survey payload: the config hash covers the config,
+    updated_at the metadata, and is_open the time-dependent flag.
+    """
+    return f'"{config_hash[:20]}-{updated_at.timestamp():.6f}-{int(is_open)}"'
 
 
 @router.get("/{slug}/public", response_model=SurveyPublicResponse)
 async def get_public_survey(
     slug: str,
+    request: Request,
+    response: HTTPResponse,
     db: AsyncSession = Depends(get_db),
-) -> SurveyPublicResponse:
+) -> SurveyPublicResponse | HTTPResponse:
     """Get survey for rendering (public access, no auth required)."""
     survey = await get_survey_by_slug(db, slug)
+    is_open = is_survey_open(survey)
+
+    etag = public_survey_etag(survey.config_hash, survey.updated_at, is_open)
+    if request.headers.get("if-none-match") == etag:
+        return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
 
     return SurveyPublicResponse(
         slug=survey.slug,
         title=survey.title,
         description=survey.description,
-        config=survey.config,
+        config=await survey_cache.config(db, survey.config_hash),
         opens_at=survey.opens_at,
         closes_at=survey.closes_at,
-        is_open=is_survey_open(survey),
+        is_open=is_open,
     )
 
 
@@ -116,11 +210,24 @@ async def submit_response(
     """
     Submit or update a survey response (upsert).
 
-    - If is_draft=True: saves as draft (auto-save)
+    - If is_draft=True: saves as draft (auto-save), rate limited per user;
+      a draft with unchanged answers is not rewritten
     - If is_draft=False: marks as submitted (sets submitted_at)
+    - If revision is sent and another tab saved since, returns 409
     """
     survey = await get_survey_by_slug(db, slug)
 
+    if response_data.is_draft and respond_rate_limiter is not None:
+        retry_after = await respond_rate_limiter.acquire(
+            db, f"respond:{current_user.id}:{survey.id}"
+        )
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many auto-saves, please slow down",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
     # Check if survey is open for responses
     if not is_survey_open(survey):
         raise HTTPException(
@@ -128,42 +235,64 @@ async def submit_response(
             detail="Survey is not currently accepting responses",
         )
 
-    # Check for existing response
+    config = await survey_cache.config(db, survey.config_hash)
     result = await db.execute(
-        select(Response).where(
-            Response.survey_id == survey.id,
-            Response.user_id == current_user.id,
-        )
+        response_upsert_statement(
+            survey.id,
+            current_user.id,
+            response_data.answers,
+            response_data.is_draft,
+            response_data.revision,
+            searchable_text(config, response_data.answers),
+        ),
+        execution_options={"populate_existing": True},
     )
     response = result.scalar_one_or_none()
 
+    # No row written: find out why from the current state
     if response is None:
-        # Create new response
-        response = Response(
-            survey_id=survey.id,
-            user_id=current_user.id,
-            answers=response_data.answers,
-            is_draft=response_data.is_draft,
+        result = await db.execute(
+            user_response_statement(survey.id, current_user.id),
+            execution_options={"populate_existing": True},
         )
-        if not response_data.is_draft:
-            response.submitted_at = datetime.utcnow()
-        db.add(response)
-    else:
-        # Update existing response
-        # Don't allow updates to already submitted responses
-        if not response.is_draft:
+        response = result.scalar_one_or_none()
+
+        if response is not None and not response.is_draft:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Cannot modify an already submitted response",
             )
+        if response is None or (
+            response_data.revision is not None and response_data.revision != response.revision
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Response was changed elsewhere; reload it before saving",
+            )
+
+        # Unchanged autosave: the response row was not rewritten
+        await db.commit()
+        return ResponseResponse.model_validate(response)
+
+    # Submitted answers are also stored typed, for per-question analytics
+    if not response.is_draft:
+        await write_typed_answers(
+            db,
+            typed_answer_rows(
+                question_map(config),
+                survey.id,
+                response.id,
+                response.answers,
+            ),
+        )
 
-        response.answers = response_data.answers
-        response.is_draft = response_data.is_draft
-        if not response_data.is_draft:
-            response.submitted_at = datetime.utcnow()
+    # The insert path stamps both timestamps with the same value
+    created = response.created_at == response.updated_at
+    # Live feeds get new and finalized responses, not every autosave
+    if created or not response.is_draft:
+        await db.execute(notify_statement(response_event(response, current_user, created)))
 
     await db.commit()
-    await db.refresh(response)
 
     return ResponseResponse.model_validate(response)
 
@@ -177,12 +306,7 @@ async def get_my_response(
     """Get the current user's response to a survey."""
     survey = await get_survey_by_slug(db, slug)
 
-    result = await db.execute(
-        select(Response).where(
-            Response.survey_id == survey.id,
-            Response.user_id == current_user.id,
-        )
-    )
+    result = await db.execute(user_response_statement(survey.id, current_user.id))
     response = result.scalar_one_or_none()
 
     if response is None:
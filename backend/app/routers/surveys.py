@@ -1,16 +1,23 @@
+import asyncio
+import json
 import re
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import Delete, Select, Update, and_, delete, func, null, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.database import get_db
+from app.database import get_admin_db, get_bulk_db, get_bulk_session_factory
 from app.models.response import Response
 from app.models.survey import Survey
 from app.models.user import User
+from app.schemas.bulk import BulkIdsRequest, BulkOperationResponse
+from app.schemas.crosstab import CrosstabResponse
+from app.schemas.imports import ImportReport
 from app.schemas.response import ResponseListItem
 from app.schemas.survey import (
     SurveyCreate,
@@ -18,10 +25,50 @@ from app.schemas.survey import (
     SurveyResponse,
     SurveyUpdate,
 )
+from app.services.answer_filters import AnswerFilter, answer_conditions, parse_answer_filters
+from app.services.crosstab import CATEGORICAL_TYPES, compute_crosstab
+from app.services.export import (
+    COMPRESSION_SUFFIXES,
+    MAX_ARCHIVE_SURVEYS,
+    MAX_EXPORT_QUESTIONS,
+    MEDIA_TYPES,
+    ExportFilters,
+    build_xlsx,
+    compress_stream,
+    stream_archive,
+    stream_csv,
+    stream_json,
+)
+from app.services.export_executor import (
+    ExportQueueFull,
+    ExportReservation,
+    ExportStreamingResponse,
+    export_executor,
+)
+from app.services.live import response_counts_statement, response_feed
+from app.services.questions import question_map
+from app.services.response_import import import_responses
+from app.services.search import SEARCH_LANGUAGE, search_query, searchable_text_expression
+from app.services.survey_cache import slug_changed_statement, survey_cache, survey_changed_statement
+from app.services.survey_config import store_config
 from app.utils.security import get_current_admin
+from app.utils.serialization import rows_response
 
 router = APIRouter(prefix="/surveys", tags=["surveys"])
 
+# Comment line sent on idle live feeds so proxies keep the connection open
+LIVE_FEED_KEEPALIVE_SECONDS = 15
+
+# answer= filters per listing or export request
+MAX_ANSWER_FILTERS = 20
+
+# Search results per page, by default and at most
+SEARCH_PAGE_SIZE = 50
+MAX_SEARCH_PAGE_SIZE = 200
+
+# Retry-After sent when the export queue is full
+EXPORT_RETRY_AFTER_SECONDS = 30
+
 
 def generate_slug(title: str) -> str:
     """Generate a URL-safe slug from the title."""
@@ -39,7 +86,7 @@ async def get_unique_slug(db: AsyncSession, base_slug: str) -> str:
     counter = 1
 
     while True:
-        result = await db.execute(select(Survey).where(Survey.slug == slug))
+        result = await db.execute(select(Survey.id).where(Survey.slug == slug))
         if result.scalar_one_or_none() is None:
             return slug
         slug = f"{base_slug}-{counter}"
@@ -47,16 +94,21 @@ async def get_unique_slug(db: AsyncSession, base_slug: str) -> str:
 
 
 async def get_survey_for_admin(
-    survey_id: UUID, db: AsyncSession, admin: User
+    survey_id: UUID, db: AsyncSession, admin: User, with_config: bool = False
 ) -> Survey:
-    """Get a survey by ID, verifying ownership and not deleted."""
-    result = await db.execute(
-        select(Survey).where(
-            Survey.id == survey_id,
-            Survey.created_by == admin.id,
-            Survey.deleted_at.is_(None),
-        )
+    """
+    Get a survey by ID, verifying ownership and not deleted. The config
+    document is only loaded (and `survey.config` only readable) with
+    `with_config`.
+    """
+    stmt = select(Survey).where(
+        Survey.id == survey_id,
+        Survey.created_by == admin.id,
+        Survey.deleted_at.is_(None),
     )
+    if with_config:
+        stmt = stmt.options(joinedload(Survey.config_document))
+    result = await db.execute(stmt)
     survey = result.scalar_one_or_none()
 
     if survey is None:
@@ -71,7 +123,7 @@ async def get_survey_for_admin(
 @router.post("/", response_model=SurveyResponse, status_code=status.HTTP_201_CREATED)
 async def create_survey(
     survey_data: SurveyCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> SurveyResponse:
     """Create a new survey from JSON configuration."""
@@ -82,29 +134,40 @@ async def create_survey(
         slug=slug,
         title=survey_data.title,
         description=survey_data.description,
-        config=survey_data.config,
+        config_hash=await store_config(db, survey_data.config),
         created_by=admin.id,
         opens_at=survey_data.opens_at,
         closes_at=survey_data.closes_at,
     )
 
     db.add(survey)
+    # Clears any cached "not found" for the new slug
+    await db.execute(slug_changed_statement(slug))
     await db.commit()
+    survey_cache.invalidate(slug)
     await db.refresh(survey)
+    await db.refresh(survey, ["config_document"])
 
     return SurveyResponse.model_validate(survey)
 
 
 @router.get("/", response_model=list[SurveyListItem])
 async def list_surveys(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> list[SurveyListItem]:
     """List all surveys created by the current admin."""
     # Get surveys with response counts
     stmt = (
         select(
-            Survey,
+            Survey.id,
+            Survey.slug,
+            Survey.title,
+            Survey.description,
+            Survey.opens_at,
+            Survey.closes_at,
+            Survey.created_at,
+            Survey.updated_at,
             func.count(Response.id).label("response_count"),
         )
         .outerjoin(Response, Survey.id == Response.survey_id)
@@ -116,30 +179,226 @@ async def list_surveys(
     result = await db.execute(stmt)
     rows = result.all()
 
-    return [
-        SurveyListItem(
-            id=row.Survey.id,
-            slug=row.Survey.slug,
-            title=row.Survey.title,
-            description=row.Survey.description,
-            opens_at=row.Survey.opens_at,
-            closes_at=row.Survey.closes_at,
-            created_at=row.Survey.created_at,
-            updated_at=row.Survey.updated_at,
-            response_count=row.response_count,
-        )
+    return rows_response([
+        {
+            "id": row.id,
+            "slug": row.slug,
+            "title": row.title,
+            "description": row.description,
+            "opens_at": row.opens_at,
+            "closes_at": row.closes_at,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "response_count": row.response_count,
+        }
         for row in rows
-    ]
+    ])
+
+
+def owned_surveys_update(ids: list[UUID], admin: User) -> Update:
+    """UPDATE of the admin's live surveys among `ids`, returning the ids it touched."""
+    return (
+        update(Survey)
+        .where(
+            Survey.id.in_(ids),
+            Survey.created_by == admin.id,
+            Survey.deleted_at.is_(None),
+        )
+        .returning(Survey.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def foreign_surveys(ids: list[UUID], admin: User) -> Select:
+    """Ids among `ids` of live surveys owned by another admin."""
+    return select(Survey.id).where(
+        Survey.id.in_(ids), Survey.created_by != admin.id, Survey.deleted_at.is_(None)
+    )
+
+
+def bulk_outcomes(
+    ids: list[UUID], affected: set[UUID], forbidden: set[UUID]
+) -> BulkOperationResponse:
+    """
+    Per-id outcomes in request order: ok, forbidden for rows of another
+    admin's surveys, and not_found for missing or deleted ones.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    return BulkOperationResponse(
+        affected=len(affected),
+        results=[
+            {
+                "id": id_,
+                "status": "ok" if id_ in affected else "forbidden" if id_ in forbidden else "not_found",
+            }
+            for id_ in unique_ids
+        ],
+    )
+
+
+async def run_bulk(
+    db: AsyncSession,
+    stmt: Update | Delete,
+    ids: list[UUID],
+    foreign: Select,
+    surveys_changed: bool = False,
+) -> BulkOperationResponse:
+    """
+    Execute a set-based statement returning ids, commit, and report outcomes.
+    `foreign` selects the ids the admin may not touch; it only runs when
+    some ids were left unaffected. With `surveys_changed`, the affected
+    surveys are evicted from every worker's survey cache.
+    """
+    result = await db.execute(stmt)
+    affected = set(result.scalars().all())
+    forbidden: set[UUID] = set()
+    if len(affected) < len(set(ids)):
+        forbidden = set((await db.execute(foreign)).scalars().all())
+    changed_slugs: list[str] = []
+    if surveys_changed and affected:
+        changed = await db.execute(survey_changed_statement(Survey.id.in_(affected)))
+        changed_slugs = list(changed.scalars().all())
+    await db.commit()
+    for slug in changed_slugs:
+        survey_cache.invalidate(slug)
+    return bulk_outcomes(ids, affected, forbidden)
+
+
+@router.post("/bulk/close", response_model=BulkOperationResponse)
+async def bulk_close_surveys(
+    request: BulkIdsRequest,
+    db: AsyncSession = Depends(get_bulk_db),
+    admin: User = Depends(get_current_admin),
+) -> BulkOperationResponse:
+    """Close surveys now. Surveys that already closed keep their earlier closing time."""
+    stmt = owned_surveys_update(request.ids, admin).values(
+        closes_at=func.least(func.coalesce(Survey.closes_at, func.now()), func.now())
+    )
+    return await run_bulk(
+        db, stmt, request.ids, foreign_surveys(request.ids, admin), surveys_changed=True
+    )
+
+
+@router.post("/bulk/reopen", response_model=BulkOperationResponse)
+async def bulk_reopen_surveys(
+    request: BulkIdsRequest,
+    db: AsyncSession = Depends(get_bulk_db),
+    admin: User = Depends(get_current_admin),
+) -> BulkOperationResponse:
+    """Reopen surveys by clearing their closing time."""
+    stmt = owned_surveys_update(request.ids, admin).values(closes_at=None)
+    return await run_bulk(
+        db, stmt, request.ids, foreign_surveys(request.ids, admin), surveys_changed=True
+    )
+
+
+@router.post("/bulk/delete", response_model=BulkOperationResponse)
+async def bulk_delete_surveys(
+    request: BulkIdsRequest,
+    db: AsyncSession = Depends(get_bulk_db),
+    admin: User = Depends(get_current_admin),
+) -> BulkOperationResponse:
+    """Soft-delete surveys."""
+    stmt = owned_surveys_update(request.ids, admin).values(deleted_at=func.now())
+    return await run_bulk(
+        db, stmt, request.ids, foreign_surveys(request.ids, admin), surveys_changed=True
+    )
+
+
+@router.post("/bulk/delete-responses", response_model=BulkOperationResponse)
+async def bulk_delete_responses(
+    request: BulkIdsRequest,
+    db: AsyncSession = Depends(get_bulk_db),
+    admin: User = Depends(get_current_admin),
+) -> BulkOperationResponse:
+    """Permanently delete responses to the admin's live surveys."""
+    stmt = (
+        delete(Response)
+        .where(
+            Response.id.in_(request.ids),
+            Response.survey_id == Survey.id,
+            Survey.created_by == admin.id,
+            Survey.deleted_at.is_(None),
+        )
+        .returning(Response.id)
+        .execution_options(synchronize_session=False)
+    )
+    foreign = (
+        select(Response.id)
+        .join(Survey, Response.survey_id == Survey.id)
+        .where(
+            Response.id.in_(request.ids),
+            Survey.created_by != admin.id,
+            Survey.deleted_at.is_(None),
+        )
+    )
+    return await run_bulk(db, stmt, request.ids, foreign)
+
+
+def reserve_export() -> ExportReservation:
+    """Take a place in the export queue, or refuse the export when it is full."""
+    try:
+        return export_executor.reserve()
+    except ExportQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many exports in progress, try again shortly",
+            headers={"Retry-After": str(EXPORT_RETRY_AFTER_SECONDS)},
+        )
+
+
+@router.get("/export-archive")
+async def export_survey_archive(
+    ids: list[UUID] = Query(..., min_length=1, max_length=MAX_ARCHIVE_SURVEYS),
+    format: str = Query("csv", pattern="^(json|csv)$"),
+    db: AsyncSession = Depends(get_bulk_db),
+    sessions: Callable[[], AsyncSession] = Depends(get_bulk_session_factory),
+    admin: User = Depends(get_current_admin),
+) -> StreamingResponse:
+    """
+    Export several surveys as one ZIP archive (`?ids=...&ids=...`), one
+    JSON or CSV member per survey, streamed as the rows are read.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    result = await db.execute(
+        select(Survey.id, Survey.slug).where(
+            Survey.id.in_(unique_ids),
+            Survey.created_by == admin.id,
+            Survey.deleted_at.is_(None),
+        )
+    )
+    slugs = dict(result.all())
+
+    if len(slugs) != len(unique_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Survey not found",
+        )
+
+    # Each member reads through its own session; release this one first
+    await db.close()
+
+    # No awaits from here until the response owns the reservation
+    reservation = reserve_export()
+    archive = stream_archive(
+        sessions, [(survey_id, slugs[survey_id]) for survey_id in unique_ids], format
+    )
+    return ExportStreamingResponse(
+        export_executor.stream(archive, reservation),
+        reservation,
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=surveys-export.zip"},
+    )
 
 
 @router.get("/{survey_id}", response_model=SurveyResponse)
 async def get_survey(
     survey_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> SurveyResponse:
     """Get survey details by ID."""
-    survey = await get_survey_for_admin(survey_id, db, admin)
+    survey = await get_survey_for_admin(survey_id, db, admin, with_config=True)
     return SurveyResponse.model_validate(survey)
 
 
@@ -147,7 +406,7 @@ async def get_survey(
 async def update_survey(
     survey_id: UUID,
     survey_data: SurveyUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> SurveyResponse:
     """Update survey metadata."""
@@ -157,8 +416,11 @@ async def update_survey(
     for field, value in update_data.items():
         setattr(survey, field, value)
 
+    await db.execute(slug_changed_statement(survey.slug))
     await db.commit()
+    survey_cache.invalidate(survey.slug)
     await db.refresh(survey)
+    await db.refresh(survey, ["config_document"])
 
     return SurveyResponse.model_validate(survey)
 
@@ -166,22 +428,24 @@ async def update_survey(
 @router.delete("/{survey_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_survey(
     survey_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> None:
     """Soft-delete a survey."""
     survey = await get_survey_for_admin(survey_id, db, admin)
     survey.deleted_at = datetime.utcnow()
+    await db.execute(slug_changed_statement(survey.slug))
     await db.commit()
+    survey_cache.invalidate(survey.slug)
 
 
 @router.post("/{survey_id}/duplicate", response_model=SurveyResponse, status_code=status.HTTP_201_CREATED)
 async def duplicate_survey(
     survey_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> SurveyResponse:
-    """Duplicate an existing survey."""
+    """Duplicate an existing survey (the config document itself is shared, not copied)."""
     original = await get_survey_for_admin(survey_id, db, admin)
 
     base_slug = generate_slug(f"{original.title} copy")
@@ -191,15 +455,18 @@ async def duplicate_survey(
         slug=slug,
         title=f"{original.title} (Copy)",
         description=original.description,
-        config=original.config,
+        config_hash=original.config_hash,
         created_by=admin.id,
         opens_at=None,
         closes_at=None,
     )
 
     db.add(duplicate)
+    await db.execute(slug_changed_statement(slug))
     await db.commit()
+    survey_cache.invalidate(slug)
     await db.refresh(duplicate)
+    await db.refresh(duplicate, ["config_document"])
 
     return SurveyResponse.model_validate(duplicate)
 
@@ -207,171 +474,304 @@ async def duplicate_survey(
 @router.get("/{survey_id}/responses", response_model=list[ResponseListItem])
 async def list_survey_responses(
     survey_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    q: str | None = Query(
+        None, min_length=1, max_length=200, description="Full-text search over free-text answers"
+    ),
+    answer: list[str] | None = Query(
+        None, max_length=MAX_ANSWER_FILTERS, description="Answer filters, e.g. Q5:Yes (repeatable)"
+    ),
+    limit: int = Query(
+        SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE, description="Search results per page"
+    ),
+    offset: int = Query(0, ge=0, description="Search results to skip"),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> list[ResponseListItem]:
-    """List all responses for a survey."""
-    survey = await get_survey_for_admin(survey_id, db, admin)
+    """
+    List all responses for a survey. With `q`, only responses whose
+    free-text answers match are returned, best matches first, each with
+    a highlighted snippet, one page (`limit`, `offset`) at a time. Each
+    `answer=QID:value` keeps only responses with that answer (for
+    multi-select questions, with that option selected).
+    """
+    survey = await get_survey_for_admin(survey_id, db, admin, with_config=bool(q or answer))
+    answer_filters = survey_answer_filters(survey, answer)
+
+    conditions = [Response.survey_id == survey.id, *answer_conditions(survey.id, answer_filters)]
+
+    if q:
+        query = search_query(q)
+        # Rank every match but fetch rows, and build snippets, for one page only
+        rank = func.ts_rank(Response.search_vector, query).label("rank")
+        page = (
+            select(Response.id, Response.survey_id, rank)
+            .where(*conditions, Response.search_vector.bool_op("@@")(query))
+            .order_by(rank.desc(), Response.created_at.desc(), Response.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        stmt = (
+            select(
+                Response,
+                User.github_username,
+                page.c.rank,
+                func.ts_headline(
+                    SEARCH_LANGUAGE,
+                    searchable_text_expression(survey.config),
+                    query,
+                    "MaxFragments=2, MinWords=5, MaxWords=20",
+                ).label("snippet"),
+            )
+            .join(page, and_(Response.id == page.c.id, Response.survey_id == page.c.survey_id))
+            .order_by(page.c.rank.desc(), Response.created_at.desc(), Response.id)
+        )
+    else:
+        stmt = (
+            select(
+                Response,
+                User.github_username,
+                null().label("rank"),
+                null().label("snippet"),
+            )
+            .where(*conditions)
+            .order_by(Response.created_at.desc())
+        )
 
-    stmt = (
-        select(Response, User.github_username)
-        .join(User, Response.user_id == User.id)
-        .where(Response.survey_id == survey.id)
-        .order_by(Response.created_at.desc())
-    )
+    stmt = stmt.join(User, Response.user_id == User.id)
 
     result = await db.execute(stmt)
     rows = result.all()
 
-    return [
-        ResponseListItem(
-            id=row.Response.id,
-            user_id=row.Response.user_id,
-            github_username=row.github_username,
-            answers=row.Response.answers,
-            is_draft=row.Response.is_draft,
-            submitted_at=row.Response.submitted_at,
-            created_at=row.Response.created_at,
-            updated_at=row.Response.updated_at,
-        )
+    return rows_response([
+        {
+            "id": row.Response.id,
+            "user_id": row.Response.user_id,
+            "github_username": row.github_username,
+            "answers": row.Response.answers,
+            "is_draft": row.Response.is_draft,
+            "submitted_at": row.Response.submitted_at,
+            "created_at": row.Response.created_at,
+            "updated_at": row.Response.updated_at,
+            "rank": row.rank,
+            "snippet": row.snippet,
+        }
         for row in rows
-    ]
+    ])
 
 
-@router.get("/{survey_id}/export")
-async def export_survey_responses(
+def survey_answer_filters(survey: Survey, answer: list[str] | None) -> tuple[AnswerFilter, ...]:
+    """Parse `answer=QID:value` query filters against the survey's questions."""
+    if not answer:
+        return ()
+    try:
+        return parse_answer_filters(question_map(survey.config), answer)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
+        ) from None
+
+
+def sse_message(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+async def live_response_events(survey_id: UUID, total: int, submitted: int) -> AsyncIterator[bytes]:
+    """Server-sent events for one survey: new and finalized responses, then updated counts."""
+    async with response_feed.subscribe(survey_id) as queue:
+        yield sse_message("counts", {"total": total, "submitted": submitted})
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), LIVE_FEED_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if event is None:
+                return
+
+            total += event["created"]
+            submitted += not event["is_draft"]
+            yield sse_message("response", event)
+            yield sse_message("counts", {"total": total, "submitted": submitted})
+
+
+@router.get("/{survey_id}/responses/stream")
+async def stream_survey_responses(
     survey_id: UUID,
-    format: str = Query("json", pattern="^(json|csv|xlsx)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_admin_db),
     admin: User = Depends(get_current_admin),
 ) -> StreamingResponse:
-    """Export survey responses as JSON, CSV, or XLSX."""
+    """
+    Live feed of a survey's responses as server-sent events.
+
+    Sends the current counts, then a `response` event for every new or
+    submitted response followed by the updated `counts`.
+    """
     survey = await get_survey_for_admin(survey_id, db, admin)
+    counts = (await db.execute(response_counts_statement(survey.id))).one()
 
-    stmt = (
-        select(Response, User.github_username)
-        .join(User, Response.user_id == User.id)
-        .where(Response.survey_id == survey.id)
-        .order_by(Response.created_at)
+    # Events arrive over the shared listener; don't hold a pooled connection
+    await db.close()
+
+    return StreamingResponse(
+        live_response_events(survey.id, counts.total, counts.submitted),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    result = await db.execute(stmt)
-    rows = result.all()
 
-    if format == "json":
-        import json
+@router.get("/{survey_id}/crosstab", response_model=CrosstabResponse)
+async def get_survey_crosstab(
+    survey_id: UUID,
+    row: str = Query(..., description="Question id for the table rows"),
+    col: str = Query(..., description="Question id for the table columns"),
+    mean: str | None = Query(None, description="Scale question averaged per cell"),
+    db: AsyncSession = Depends(get_admin_db),
+    admin: User = Depends(get_current_admin),
+) -> CrosstabResponse:
+    """
+    Cross-tabulate two questions over submitted responses, computed in the
+    database. Multi-select answers count once per selected option.
+    """
+    survey = await get_survey_for_admin(survey_id, db, admin, with_config=True)
+    questions = question_map(survey.config)
+
+    for question_id in (row, col, mean):
+        if question_id is not None and question_id not in questions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown question: {question_id}",
+            )
+    for question_id in (row, col):
+        if questions[question_id]["type"] not in CATEGORICAL_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Question {question_id} has free-text answers and cannot be tabulated",
+            )
+    if mean is not None and questions[mean]["type"] != "scale_1_5":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Question {mean} is not a scale question",
+        )
 
-        data = [
-            {
-                "id": str(row.Response.id),
-                "user_id": str(row.Response.user_id),
-                "github_username": row.github_username,
-                "answers": row.Response.answers,
-                "is_draft": row.Response.is_draft,
-                "submitted_at": row.Response.submitted_at.isoformat() if row.Response.submitted_at else None,
-                "created_at": row.Response.created_at.isoformat(),
-                "updated_at": row.Response.updated_at.isoformat(),
-            }
-            for row in rows
-        ]
+    return await compute_crosstab(
+        db,
+        survey.id,
+        questions[row],
+        questions[col],
+        questions[mean] if mean is not None else None,
+    )
 
-        content = json.dumps(data, indent=2)
-        return StreamingResponse(
-            iter([content]),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={survey.slug}-responses.json"},
-        )
 
-    elif format == "xlsx":
-        import io
-        import json
-        from openpyxl import Workbook
-
-        # Collect all unique question IDs from answers
-        all_question_ids: set[str] = set()
-        for row in rows:
-            all_question_ids.update(row.Response.answers.keys())
-
-        sorted_question_ids = sorted(all_question_ids)
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Responses"
-
-        # Header row
-        header = ["id", "user_id", "github_username", "is_draft", "submitted_at", "created_at"] + sorted_question_ids
-        ws.append(header)
-
-        # Data rows
-        for row in rows:
-            xlsx_row = [
-                str(row.Response.id),
-                str(row.Response.user_id),
-                row.github_username,
-                str(row.Response.is_draft),
-                row.Response.submitted_at.isoformat() if row.Response.submitted_at else "",
-                row.Response.created_at.isoformat(),
-            ]
-            for qid in sorted_question_ids:
-                answer = row.Response.answers.get(qid, "")
-                # Handle complex answer types (lists, dicts)
-                if isinstance(answer, (list, dict)):
-                    xlsx_row.append(json.dumps(answer))
-                else:
-                    xlsx_row.append(str(answer) if answer else "")
-            ws.append(xlsx_row)
-
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
+@router.get("/{survey_id}/export")
+async def export_survey_responses(
+    survey_id: UUID,
+    format: str = Query("json", pattern="^(json|csv|xlsx)$"),
+    compress: str | None = Query(None, pattern="^(gzip|zstd)$"),
+    status_filter: str = Query("all", alias="status", pattern="^(all|submitted|draft)$"),
+    from_date: datetime | None = Query(None, description="Earliest submitted_at (inclusive)"),
+    to_date: datetime | None = Query(None, description="Latest submitted_at (inclusive)"),
+    anonymize: bool = Query(False, description="Replace respondents with respondent_N"),
+    questions: list[str] | None = Query(None, max_length=MAX_EXPORT_QUESTIONS),
+    answer: list[str] | None = Query(
+        None, max_length=MAX_ANSWER_FILTERS, description="Answer filters, e.g. Q5:Yes (repeatable)"
+    ),
+    db: AsyncSession = Depends(get_bulk_db),
+    sessions: Callable[[], AsyncSession] = Depends(get_bulk_session_factory),
+    admin: User = Depends(get_current_admin),
+) -> StreamingResponse:
+    """
+    Export survey responses as JSON, CSV, or XLSX.
+
+    JSON and CSV are streamed as rows are read, optionally compressed on
+    the fly with gzip or zstd (sent with the matching Content-Encoding).
+    Status, submission date range, `answer=QID:value` filters and
+    `questions=` (repeatable) subsets are applied in the database, so only
+    the requested rows and answers are read. Encoding runs on the bounded
+    export pool; when its queue is full the request gets a 503.
+    """
+    survey = await get_survey_for_admin(survey_id, db, admin, with_config=bool(answer))
+    filters = ExportFilters(
+        status=status_filter,
+        from_date=from_date,
+        to_date=to_date,
+        anonymize=anonymize,
+        questions=tuple(dict.fromkeys(questions)) if questions else None,
+        answers=survey_answer_filters(survey, answer),
+    )
+    filename = f"{survey.slug}-responses.{format}"
+
+    if format == "xlsx":
+        if compress:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Compression is only available for JSON and CSV exports",
+            )
 
+        async with export_executor.slot(reserve_export()):
+            workbook = await build_xlsx(db, survey.id, filters)
         return StreamingResponse(
-            output,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={survey.slug}-responses.xlsx"},
+            workbook,
+            media_type=MEDIA_TYPES[format],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
-    else:  # CSV
-        import csv
-        import io
-
-        # Collect all unique question IDs from answers
-        all_question_ids: set[str] = set()
-        for row in rows:
-            all_question_ids.update(row.Response.answers.keys())
-
-        sorted_question_ids = sorted(all_question_ids)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        header = ["id", "user_id", "github_username", "is_draft", "submitted_at", "created_at"] + sorted_question_ids
-        writer.writerow(header)
-
-        # Data rows
-        for row in rows:
-            csv_row = [
-                str(row.Response.id),
-                str(row.Response.user_id),
-                row.github_username,
-                str(row.Response.is_draft),
-                row.Response.submitted_at.isoformat() if row.Response.submitted_at else "",
-                row.Response.created_at.isoformat(),
-            ]
-            for qid in sorted_question_ids:
-                answer = row.Response.answers.get(qid, "")
-                # Handle complex answer types (lists, dicts)
-                if isinstance(answer, (list, dict)):
-                    import json
-                    csv_row.append(json.dumps(answer))
-                else:
-                    csv_row.append(str(answer) if answer else "")
-            writer.writerow(csv_row)
-
-        content = output.getvalue()
-        return StreamingResponse(
-            iter([content]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={survey.slug}-responses.csv"},
+    # The stream reads through its own session; release this one first
+    await db.close()
+
+    # No awaits from here until the response owns the reservation
+    reservation = reserve_export()
+    if format == "json":
+        body = stream_json(sessions, survey.id, filters)
+    else:
+        body = stream_csv(sessions, survey.id, filters)
+    headers = {}
+    if compress:
+        body = compress_stream(body, compress)
+        filename += COMPRESSION_SUFFIXES[compress]
+        headers["Content-Encoding"] = compress
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+
+    return ExportStreamingResponse(
+        export_executor.stream(body, reservation),
+        reservation,
+        media_type=MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
+@router.post("/{survey_id}/responses/import", response_model=ImportReport)
+async def import_survey_responses(
+    survey_id: UUID,
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    db: AsyncSession = Depends(get_bulk_db),
+    admin: User = Depends(get_current_admin),
+) -> ImportReport:
+    """
+    Import submitted responses collected offline, keyed by GitHub username.
+
+    The request body is the raw file, read as it streams in:
+    - CSV with a github_username column and one column per question ID,
+      in the CSV export's format (optional submitted_at)
+    - NDJSON with one {"github_username", "answers", "submitted_at"?}
+      object per line
+
+    Rows are validated against the survey's questions. A respondent's
+    draft is replaced by the imported submission; an existing submission
+    is kept. Rejected rows are listed in the report and the rest are
+    imported. The survey's opening window does not apply.
+    """
+    survey = await get_survey_for_admin(survey_id, db, admin, with_config=True)
+    try:
+        report = await import_responses(db, survey.id, survey.config, request.stream(), format)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
         )
+    await db.commit()
+    return ImportReport.model_validate(report)
@@ -12,7 +12,11 @@ from app.schemas.response import (
     ResponseResponse,
     ResponseListItem,
     MyResponseResponse,
+    MyResponseListItem,
 )
+from app.schemas.bulk import BulkIdsRequest, BulkItemResult, BulkOperationResponse
+from app.schemas.crosstab import CrosstabCell, CrosstabResponse
+from app.schemas.imports import ImportReport, ImportRowError
 
 __all__ = [
     "UserResponse",
@@ -26,4 +30,12 @@ __all__ = [
     "ResponseResponse",
     "ResponseListItem",
     "MyResponseResponse",
+    "MyResponseListItem",
+    "BulkIdsRequest",
+    "BulkItemResult",
+    "BulkOperationResponse",
+    "CrosstabCell",
+    "CrosstabResponse",
+    "ImportRowError",
+    "ImportReport",
 ]
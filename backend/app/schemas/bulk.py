@@ -0,0 +1,27 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+# Upper bound on ids per bulk request, keeping the IN lists reasonable
+MAX_BULK_IDS = 1000
+
+
+class BulkIdsRequest(BaseModel):
+    """Schema for a bulk operation on a set of surveys or responses."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BULK_IDS)
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of a bulk operation for one id."""
+
+    id: UUID
+    status: Literal["ok", "forbidden", "not_found"]
+
+
+class BulkOperationResponse(BaseModel):
+    """Schema for the result of a bulk operation."""
+
+    affected: int
+    results: list[BulkItemResult]
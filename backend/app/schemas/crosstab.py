@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+class CrosstabCell(BaseModel):
+    """One cell of a contingency table."""
+
+    row: str
+    col: str
+    count: int
+    mean: float | None = None
+
+
+class CrosstabResponse(BaseModel):
+    """Contingency table of two questions over submitted responses."""
+
+    row: str
+    col: str
+    mean: str | None
+    row_values: list[str]
+    col_values: list[str]
+    responses: int
+    cells: list[CrosstabCell]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    """A rejected row of a response import."""
+
+    # CSV row (the header is row 1) or NDJSON line number
+    row: int
+    github_username: str | None
+    error: str
+
+
+class ImportReport(BaseModel):
+    """Schema for the result of a response import."""
+
+    received: int
+    imported: int
+    error_count: int
+    # The first errors by row; error_count has the total
+    errors: list[ImportRowError]
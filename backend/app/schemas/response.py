@@ -9,6 +9,9 @@ class ResponseCreate(BaseModel):
 
     answers: dict = Field(default_factory=dict, description="Answer data keyed by question_id")
     is_draft: bool = Field(True, description="True for auto-save, False for final submission")
+    revision: int | None = Field(
+        None, description="Revision the client last saw; a stale one is rejected with 409"
+    )
 
 
 class ResponseResponse(BaseModel):
@@ -19,6 +22,7 @@ class ResponseResponse(BaseModel):
     user_id: UUID
     answers: dict
     is_draft: bool
+    revision: int
     submitted_at: datetime | None
     created_at: datetime
     updated_at: datetime
@@ -37,6 +41,9 @@ class ResponseListItem(BaseModel):
     submitted_at: datetime | None
     created_at: datetime
     updated_at: datetime
+    # Set when the listing is a full-text search
+    rank: float | None = None
+    snippet: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -46,7 +53,22 @@ class MyResponseResponse(BaseModel):
 
     answers: dict
     is_draft: bool
+    revision: int
     submitted_at: datetime | None
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class MyResponseListItem(BaseModel):
+    """Schema for one of the user's responses across all surveys."""
+
+    survey_id: UUID
+    slug: str
+    title: str
+    is_draft: bool
+    submitted_at: datetime | None
+    updated_at: datetime
+    answers: dict | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, or_, select, union
+from sqlalchemy.orm import aliased
+
+from app.models.response import Response
+from app.models.response_answer import ResponseAnswer
+
+
+@dataclass(frozen=True)
+class AnswerFilter:
+    """
+    One `QID:value` filter. Submitted responses are matched on their typed
+    response_answers rows; drafts have none, so they are matched by JSONB
+    containment on answers.
+    """
+
+    question_id: str
+    # The response_answers column and value a matching row has
+    column: str
+    value: Any
+    # JSONB documents, one of which a matching draft's answers contain
+    documents: tuple[dict[str, Any], ...]
+
+
+def parse_answer_filter(question: dict[str, Any], value: str) -> AnswerFilter:
+    """
+    Type `value` like the stored answers to `question`. Raises ValueError
+    for values the question cannot hold.
+    """
+    question_id = question["question_id"]
+    question_type = question["type"]
+
+    if question_type == "scale_1_5":
+        try:
+            number = int(value)
+        except ValueError:
+            raise ValueError(f"{question_id} takes a number from 1 to 5") from None
+        return AnswerFilter(question_id, "int_value", number, ({question_id: number},))
+
+    if question_type == "open_text":
+        return AnswerFilter(question_id, "text_value", value, ({question_id: value},))
+
+    options = question.get("options")
+    if options and value not in options:
+        raise ValueError(f"{value!r} is not an option of {question_id}")
+    column, typed = ("option_index", options.index(value)) if options else ("choice_value", value)
+
+    # Drafts may hold a bare value for any question type, so match that form too
+    documents: tuple[dict[str, Any], ...] = ({question_id: value},)
+    if question_type == "multi_checkbox":
+        # Array containment: the option is among those selected
+        documents += ({question_id: [value]},)
+    elif question_type == "single_choice_with_text":
+        documents += ({question_id: {"choice": value}},)
+    return AnswerFilter(question_id, column, typed, documents)
+
+
+def parse_answer_filters(
+    questions: dict[str, dict[str, Any]], filters: list[str]
+) -> tuple[AnswerFilter, ...]:
+    """
+    Parse `QID:value` filters (`Q5:Yes`; for multi-select, `Q7:B` means B was
+    selected), one AnswerFilter per filter.
+    """
+    parsed = []
+    for item in filters:
+        question_id, separator, value = item.partition(":")
+        if not separator:
+            raise ValueError(f"Answer filter {item!r} must look like QUESTION_ID:value")
+        question = questions.get(question_id)
+        if question is None:
+            raise ValueError(f"Unknown question: {question_id}")
+        parsed.append(parse_answer_filter(question, value))
+    return tuple(parsed)
+
+
+def answer_conditions(
+    survey_id: UUID, filters: tuple[AnswerFilter, ...]
+) -> list[ColumnElement[bool]]:
+    """
+    One condition per filter: the response is among the survey's submitted
+    responses with a matching typed answer row (ix_response_answers_option
+    and friends), or among its drafts whose answers @> one of the documents
+    (the jsonb_path_ops GIN index). The two id lists are separate branches
+    of a UNION, so each is planned against its own index.
+    """
+    drafts = aliased(Response)
+    return [
+        Response.id.in_(
+            union(
+                select(ResponseAnswer.response_id).where(
+                    ResponseAnswer.survey_id == survey_id,
+                    ResponseAnswer.question_id == answer_filter.question_id,
+                    getattr(ResponseAnswer, answer_filter.column) == answer_filter.value,
+                ),
+                select(drafts.id).where(
+                    drafts.survey_id == survey_id,
+                    drafts.is_draft.is_(True),
+                    or_(*(drafts.answers.contains(document) for document in answer_filter.documents)),
+                ),
+            )
+        )
+        for answer_filter in filters
+    ]
@@ -0,0 +1,93 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models.response_answer import ResponseAnswer
+
+
+def _option_value(question: dict[str, Any], value: Any) -> dict[str, Any]:
+    """Store a choice as its option index, or as choice_value for unknown options."""
+    if value is None:
+        return {}
+    options = question.get("options", [])
+    if value in options:
+        return {"option_index": options.index(value)}
+    return {"choice_value": str(value)}
+
+
+def typed_answer_rows(
+    questions: dict[str, dict[str, Any]],
+    survey_id: UUID,
+    response_id: UUID,
+    answers: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Flatten a response's answers into response_answers rows, using the
+    question definitions (question_id -> question) to type each value.
+    Answers to unknown questions and empty answers are skipped.
+    """
+    rows: list[dict[str, Any]] = []
+
+    for question_id, value in answers.items():
+        question = questions.get(question_id)
+        if question is None or value in (None, "", [], {}):
+            continue
+
+        base = {
+            "response_id": response_id,
+            "survey_id": survey_id,
+            "question_id": question_id,
+            "item": 0,
+        }
+        question_type = question["type"]
+
+        if question_type == "scale_1_5":
+            try:
+                rows.append({**base, "int_value": int(value)})
+            except (TypeError, ValueError):
+                rows.append({**base, "choice_value": str(value)})
+        elif question_type == "multi_checkbox":
+            values = value if isinstance(value, list) else [value]
+            rows.extend(
+                {**base, "item": item, **_option_value(question, choice)}
+                for item, choice in enumerate(values)
+            )
+        elif question_type == "single_choice_with_text":
+            if isinstance(value, dict):
+                row = {**base, **_option_value(question, value.get("choice"))}
+                if value.get("text"):
+                    row["text_value"] = value["text"]
+            else:
+                row = {**base, **_option_value(question, value)}
+            rows.append(row)
+        elif question_type in ("single_choice", "dropdown"):
+            rows.append({**base, **_option_value(question, value)})
+        else:
+            rows.append({**base, "text_value": str(value)})
+
+    return rows
+
+
+async def write_typed_answers(
+    db: AsyncSession | AsyncConnection, rows: list[dict[str, Any]]
+) -> None:
+    """Insert typed answer rows, ignoring responses that were already written."""
+    if not rows:
+        return
+
+    # Every key must be present in every row for a single executemany
+    columns = ("int_value", "text_value", "option_index", "choice_value")
+    rows = [{column: None for column in columns} | row for row in rows]
+
+    await db.execute(
+        pg_insert(ResponseAnswer).on_conflict_do_nothing(
+            index_elements=[
+                ResponseAnswer.response_id,
+                ResponseAnswer.question_id,
+                ResponseAnswer.item,
+            ]
+        ),
+        rows,
+    )
@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, Text, and_, case, cast, func, null, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.response import Response
+from app.models.response_answer import ResponseAnswer
+
+# Question types that can label a crosstab row or column
+CATEGORICAL_TYPES = (
+    "scale_1_5",
+    "single_choice",
+    "multi_checkbox",
+    "dropdown",
+    "single_choice_with_text",
+)
+
+# Computed tables kept per worker
+CROSSTAB_CACHE_SIZE = 256
+
+_cache: OrderedDict[tuple, tuple[tuple, dict[str, Any]]] = OrderedDict()
+
+
+def answer_label(question: dict[str, Any], answers: type[ResponseAnswer]) -> ColumnElement:
+    """
+    A typed answer row's categorical value as text: the option for an option
+    index, the number of a scale answer, or the stored unknown choice.
+    """
+    if question["type"] == "scale_1_5":
+        known = cast(answers.int_value, Text)
+    else:
+        options = dict(enumerate(question.get("options", [])))
+        known = case(options, value=answers.option_index) if options else null()
+    return func.coalesce(known, answers.choice_value)
+
+
+def crosstab_statement(
+    survey_id: UUID,
+    row: dict[str, Any],
+    col: dict[str, Any],
+    mean: dict[str, Any] | None = None,
+) -> Select:
+    """
+    Contingency table of two questions over the typed answers of submitted
+    responses, in one aggregation. Multi-select answers have a row per
+    selection, so a response counts once in every cell its selections fall
+    into. The grand total row (both values NULL) counts distinct responses.
+    """
+    row_answers = aliased(ResponseAnswer, name="row_answers")
+    col_answers = aliased(ResponseAnswer, name="col_answers")
+    row_value = answer_label(row, row_answers)
+    col_value = answer_label(col, col_answers)
+
+    stmt = select(
+        row_value.label("row_value"),
+        col_value.label("col_value"),
+        func.count().label("count"),
+        func.count(row_answers.response_id.distinct()).label("responses"),
+    ).join_from(
+        row_answers,
+        col_answers,
+        and_(
+            col_answers.response_id == row_answers.response_id,
+            col_answers.question_id == col["question_id"],
+        ),
+    )
+    if mean is not None:
+        # A scale question has a single row, so joining it adds no rows
+        mean_answers = aliased(ResponseAnswer, name="mean_answers")
+        stmt = stmt.add_columns(func.avg(mean_answers.int_value).label("mean")).outerjoin(
+            mean_answers,
+            and_(
+                mean_answers.response_id == row_answers.response_id,
+                mean_answers.question_id == mean["question_id"],
+            ),
+        )
+
+    return stmt.where(
+        row_answers.survey_id == survey_id,
+        row_answers.question_id == row["question_id"],
+        row_value.is_not(None),
+        col_value.is_not(None),
+    ).group_by(func.grouping_sets(tuple_(row_value, col_value), tuple_()))
+
+
+def submissions_stamp_statement(survey_id: UUID) -> Select:
+    """Latest submission time and count; changes whenever the crosstab could."""
+    return select(func.max(Response.submitted_at), func.count()).where(
+        Response.survey_id == survey_id,
+        Response.is_draft.is_(False),
+    )
+
+
+def ordered_values(question: dict[str, Any], values: set[str]) -> list[str]:
+    """Config options first, in their order, then any other values seen."""
+    if question["type"] == "scale_1_5":
+        known = [str(value) for value in range(1, 6)]
+    else:
+        known = list(question.get("options", []))
+    return [value for value in known if value in values] + sorted(values - set(known))
+
+
+async def compute_crosstab(
+    db: AsyncSession,
+    survey_id: UUID,
+    row: dict[str, Any],
+    col: dict[str, Any],
+    mean: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Crosstab of `row` by `col` (question definitions), with the mean of the
+    `mean` scale question per cell. Cached until a response is submitted
+    or removed.
+    """
+    stamp = tuple((await db.execute(submissions_stamp_statement(survey_id))).one())
+    key = (survey_id, row["question_id"], col["question_id"], mean and mean["question_id"])
+
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _cache.move_to_end(key)
+        return cached[1]
+
+    result = await db.execute(crosstab_statement(survey_id, row, col, mean))
+    cells = []
+    responses = 0
+    for record in result:
+        if record.row_value is None:
+            responses = record.responses
+            continue
+        cells.append(
+            {
+                "row": record.row_value,
+                "col": record.col_value,
+                "count": record.count,
+                "mean": float(record.mean) if mean is not None and record.mean is not None else None,
+            }
+        )
+
+    table = {
+        "row": row["question_id"],
+        "col": col["question_id"],
+        "mean": mean and mean["question_id"],
+        "row_values": ordered_values(row, {cell["row"] for cell in cells}),
+        "col_values": ordered_values(col, {cell["col"] for cell in cells}),
+        "responses": responses,
+        "cells": cells,
+    }
+
+    _cache[key] = (stamp, table)
+    if len(_cache) > CROSSTAB_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return table
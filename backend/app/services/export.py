@@ -0,0 +1,310 @@
+import csv
+import io
+import json
+import zipfile
+import zlib
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import reduce
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy import ColumnElement, Select, String, cast, func, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.response import Response
+from app.models.user import User
+from app.services.answer_filters import AnswerFilter, answer_conditions
+from app.services.export_executor import export_executor
+
+# Rows fetched from the server-side cursor per round-trip while streaming
+EXPORT_BATCH_SIZE = 1000
+
+METADATA_COLUMNS = ["id", "user_id", "github_username", "is_draft", "submitted_at", "created_at"]
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# Surveys per export archive request
+MAX_ARCHIVE_SURVEYS = 100
+
+# Questions per projected export
+MAX_EXPORT_QUESTIONS = 100
+
+
+@dataclass(frozen=True)
+class ExportFilters:
+    """Export options, all applied in SQL."""
+
+    # "all", "submitted" or "draft"
+    status: str = "all"
+    # Inclusive bounds on submitted_at; either one excludes drafts
+    from_date: datetime | None = None
+    to_date: datetime | None = None
+    # Replace respondent identity with respondent_N, numbered by creation order
+    anonymize: bool = False
+    # Only these answers are read out of the JSONB blob, in this order
+    questions: tuple[str, ...] | None = None
+    # Answer filters every exported response must match
+    answers: tuple[AnswerFilter, ...] = ()
+
+
+def export_conditions(survey_id: UUID, filters: ExportFilters) -> list[ColumnElement[bool]]:
+    conditions = [Response.survey_id == survey_id]
+    if filters.status == "submitted":
+        conditions.append(Response.is_draft.is_(False))
+    elif filters.status == "draft":
+        conditions.append(Response.is_draft.is_(True))
+    if filters.from_date is not None:
+        conditions.append(Response.submitted_at >= filters.from_date)
+    if filters.to_date is not None:
+        conditions.append(Response.submitted_at <= filters.to_date)
+    conditions.extend(answer_conditions(survey_id, filters.answers))
+    return conditions
+
+
+def projected_answers(questions: tuple[str, ...]) -> ColumnElement:
+    """Only the requested keys of answers (answers -> 'qid'), without missing ones."""
+    parts = [
+        func.jsonb_build_object(literal(qid, String), Response.answers[qid])
+        for qid in questions
+    ]
+    return func.jsonb_strip_nulls(reduce(lambda left, right: left.op("||")(right), parts))
+
+
+def export_statement(survey_id: UUID, filters: ExportFilters = ExportFilters()) -> Select:
+    """Filtered responses of a survey with the respondent's username, oldest first."""
+    answers = projected_answers(filters.questions) if filters.questions else Response.answers
+
+    if filters.anonymize:
+        user_id = null()
+        username = literal("respondent_") + cast(
+            func.row_number().over(order_by=(Response.created_at, Response.id)), String
+        )
+    else:
+        user_id = Response.user_id
+        username = User.github_username
+
+    stmt = select(
+        Response.id,
+        user_id.label("user_id"),
+        username.label("github_username"),
+        answers.label("answers"),
+        Response.is_draft,
+        Response.submitted_at,
+        Response.created_at,
+        Response.updated_at,
+    ).where(*export_conditions(survey_id, filters))
+
+    if not filters.anonymize:
+        stmt = stmt.join(User, Response.user_id == User.id)
+
+    return stmt.order_by(Response.created_at, Response.id)
+
+
+async def export_question_ids(
+    db: AsyncSession, survey_id: UUID, filters: ExportFilters = ExportFilters()
+) -> list[str]:
+    """Question columns: the requested ones, or every key in any exported answer."""
+    if filters.questions:
+        return list(filters.questions)
+
+    result = await db.execute(
+        select(func.jsonb_object_keys(Response.answers))
+        .where(*export_conditions(survey_id, filters))
+        .distinct()
+    )
+    return sorted(result.scalars().all())
+
+
+def format_answer(answer: Any) -> str:
+    """Flatten an answer into a single spreadsheet cell."""
+    # Handle complex answer types (lists, dicts)
+    if isinstance(answer, (list, dict)):
+        return json.dumps(answer)
+    return str(answer) if answer else ""
+
+
+def tabular_row(row: Any, question_ids: list[str]) -> list[str]:
+    return [
+        str(row.id),
+        str(row.user_id) if row.user_id else "",
+        row.github_username,
+        str(row.is_draft),
+        row.submitted_at.isoformat() if row.submitted_at else "",
+        row.created_at.isoformat(),
+    ] + [format_answer(row.answers.get(qid, "")) for qid in question_ids]
+
+
+def json_item(row: Any) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "github_username": row.github_username,
+        "answers": row.answers,
+        "is_draft": row.is_draft,
+        "submitted_at": row.submitted_at,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def encode_csv(rows: list[Any], question_ids: list[str]) -> bytes:
+    """CSV lines for a batch of rows."""
+    output = io.StringIO()
+    csv.writer(output).writerows(tabular_row(row, question_ids) for row in rows)
+    return output.getvalue().encode()
+
+
+def encode_json(rows: list[Any], separator: bytes) -> bytes:
+    """A batch of indented JSON array items, preceded by `separator`."""
+    # orjson encodes datetimes natively; asyncpg's own UUID type goes through str
+    items = (
+        orjson.dumps(json_item(row), default=str, option=orjson.OPT_INDENT_2) for row in rows
+    )
+    return separator + b",\n".join(b"  " + item.replace(b"\n", b"\n  ") for item in items)
+
+
+def write_xlsx(rows: list[Any], question_ids: list[str]) -> io.BytesIO:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Responses"
+    ws.append(METADATA_COLUMNS + question_ids)
+    for row in rows:
+        ws.append(tabular_row(row, question_ids))
+
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+    return output
+
+
+async def stream_csv(
+    sessions: Callable[[], AsyncSession],
+    survey_id: UUID,
+    filters: ExportFilters = ExportFilters(),
+) -> AsyncIterator[bytes]:
+    """
+    Encode the export as CSV on the export pool, one chunk per fetched batch
+    of rows, reading through a session from `sessions`.
+    """
+    async with sessions() as db:
+        question_ids = await export_question_ids(db, survey_id, filters)
+        header = io.StringIO()
+        csv.writer(header).writerow(METADATA_COLUMNS + question_ids)
+        yield header.getvalue().encode()
+
+        result = await db.stream(
+            export_statement(survey_id, filters).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield await export_executor.run(encode_csv, rows, question_ids)
+
+
+async def stream_json(
+    sessions: Callable[[], AsyncSession],
+    survey_id: UUID,
+    filters: ExportFilters = ExportFilters(),
+) -> AsyncIterator[bytes]:
+    """
+    Encode the export as an indented JSON array on the export pool, one
+    chunk per fetched batch, reading through a session from `sessions`.
+    """
+    async with sessions() as db:
+        result = await db.stream(
+            export_statement(survey_id, filters).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        separator = b"[\n"
+        async for rows in result.partitions():
+            yield await export_executor.run(encode_json, rows, separator)
+            separator = b",\n"
+
+        yield b"[]" if separator == b"[\n" else b"\n]"
+
+
+async def build_xlsx(
+    db: AsyncSession, survey_id: UUID, filters: ExportFilters = ExportFilters()
+) -> io.BytesIO:
+    """
+    Build the XLSX workbook in memory (the format cannot be streamed), on
+    the export pool.
+    """
+    question_ids = await export_question_ids(db, survey_id, filters)
+    rows = (await db.execute(export_statement(survey_id, filters))).all()
+    return await export_executor.run(write_xlsx, rows, question_ids)
+
+
+async def compress_stream(chunks: AsyncIterator[bytes], method: str) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally with gzip or zstd."""
+    if method == "zstd":
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+    else:
+        # wbits=31 selects the gzip container rather than raw zlib
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    async for chunk in chunks:
+        compressed = await export_executor.run(compressor.compress, chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only, unseekable file that hands written bytes back via drain().
+    zipfile falls back to data descriptors for unseekable files, so members
+    can be streamed without knowing their size up front.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_archive(
+    sessions: Callable[[], AsyncSession], surveys: list[tuple[UUID, str]], format: str
+) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive with one export member per (survey_id, slug),
+    compressing each batch as it is read, in a single pass.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for survey_id, slug in surveys:
+            encode = stream_json if format == "json" else stream_csv
+            body = encode(sessions, survey_id)
+            # Member sizes are unknown until written, so always allow ZIP64
+            with archive.open(f"{slug}-responses.{format}", "w", force_zip64=True) as member:
+                async for chunk in body:
+                    # Deflating runs on the export pool like the encoding
+                    await export_executor.run(member.write, chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            yield sink.drain()
+
+    # Central directory
+    yield sink.drain()
@@ -0,0 +1,110 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class ExportQueueFull(Exception):
+    """Every export slot and queue place is taken."""
+
+
+class ExportReservation:
+    """A place in the export queue, held from admission until the export ends."""
+
+    def __init__(self, executor: "ExportExecutor") -> None:
+        self._executor = executor
+        self._held = True
+
+    def release(self) -> None:
+        """Give the place back; safe to call more than once."""
+        if self._held:
+            self._held = False
+            self._executor._pending -= 1
+
+
+class ExportExecutor:
+    """
+    Bounded thread pool that encodes exports off the event loop. At most
+    `workers` exports encode at once, up to `queue_size` more wait for a
+    slot, and further exports are refused rather than piling up.
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self._pool: ThreadPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(workers)
+        # Reserved exports, holding or waiting for a slot
+        self._pending = 0
+
+    def reserve(self) -> ExportReservation:
+        """
+        Admit an export, or raise ExportQueueFull. The place counts against
+        the queue at once, so a burst cannot all pass the check before any
+        of them starts; release the reservation when the export ends.
+        """
+        if self._pending >= self.workers + self.queue_size:
+            raise ExportQueueFull
+        self._pending += 1
+        return ExportReservation(self)
+
+    @asynccontextmanager
+    async def slot(self, reservation: ExportReservation) -> AsyncIterator[None]:
+        """Hold one of the encoding slots, waiting in the queue if needed."""
+        try:
+            async with self._slots:
+                yield
+        finally:
+            reservation.release()
+
+    async def stream(
+        self, chunks: AsyncIterator[bytes], reservation: ExportReservation
+    ) -> AsyncIterator[bytes]:
+        """Produce a streamed export while holding a slot."""
+        async with self.slot(reservation):
+            async for chunk in chunks:
+                yield chunk
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call `fn(*args)` on the pool."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="export")
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class ExportStreamingResponse(StreamingResponse):
+    """
+    Streams an export from ExportExecutor.stream() and frees its slot and
+    reservation however the response ends. A client that disconnects may
+    leave the body suspended or never started, so it is closed here rather
+    than left to garbage collection.
+    """
+
+    def __init__(
+        self, content: AsyncIterator[bytes], reservation: ExportReservation, **kwargs: Any
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self.reservation = reservation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
+            self.reservation.release()
+
+
+export_executor = ExportExecutor(settings.EXPORT_WORKERS, settings.EXPORT_QUEUE_SIZE)
@@ -0,0 +1,93 @@
+import asyncio
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, func, select
+
+from app.models.response import Response
+from app.models.user import User
+from app.services.notifications import pg_listener
+
+RESPONSE_CHANNEL = "survey_responses"
+
+# Events buffered per subscriber; a subscriber that falls further behind is dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+def response_event(response: Response, user: User, created: bool) -> dict[str, Any]:
+    """Payload announcing a new or finalized response (kept well under NOTIFY's 8000 bytes)."""
+    return {
+        "survey_id": str(response.survey_id),
+        "id": str(response.id),
+        "user_id": str(response.user_id),
+        "github_username": user.github_username,
+        "created": created,
+        "is_draft": response.is_draft,
+        "submitted_at": response.submitted_at.isoformat() if response.submitted_at else None,
+        "updated_at": response.updated_at.isoformat(),
+    }
+
+
+def notify_statement(event: dict[str, Any]) -> Select:
+    """pg_notify for a response event; delivered only if the transaction commits."""
+    return select(func.pg_notify(RESPONSE_CHANNEL, json.dumps(event)))
+
+
+def response_counts_statement(survey_id: UUID) -> Select:
+    """Total and submitted response counts for a survey."""
+    return select(
+        func.count().label("total"),
+        func.count().filter(Response.is_draft.is_(False)).label("submitted"),
+    ).where(Response.survey_id == survey_id)
+
+
+class ResponseFeed:
+    """
+    In-process fan-out of response notifications. The worker's shared
+    listener receives each event once, however many admins are subscribed,
+    and it is copied to the queues of that survey's subscribers.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: defaultdict[str, set[asyncio.Queue]] = defaultdict(set)
+        pg_listener.register(RESPONSE_CHANNEL, self._on_notify, on_lost=self._on_lost)
+
+    def _on_notify(self, payload: str) -> None:
+        event = json.loads(payload)
+        for queue in list(self._subscribers.get(event["survey_id"], ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._end(queue)
+
+    def _on_lost(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in list(queues):
+                self._end(queue)
+
+    def _end(self, queue: asyncio.Queue) -> None:
+        """Tell a subscriber its stream is over; clients reconnect and resync."""
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    @asynccontextmanager
+    async def subscribe(self, survey_id: UUID) -> AsyncIterator[asyncio.Queue]:
+        """Queue of events for one survey; None marks the end of the stream."""
+        await pg_listener.connect()
+        key = str(survey_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[key].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[key].discard(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+
+
+response_feed = ResponseFeed()
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import statistics
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Lag samples kept for the health endpoint's percentiles
+LAG_SAMPLES = 1000
+
+
+class LoopMonitor:
+    """
+    Measures event-loop scheduling delay and reports blocking callbacks.
+
+    A sampler task sleeps `interval` seconds at a time and records how late
+    it wakes up (the lag every other coroutine suffered meanwhile). A
+    watchdog thread notices when the sampler is overdue by more than
+    `threshold` while the loop is still blocked, and logs the loop thread's
+    stack and the request being served at that moment, once per stall.
+    """
+
+    def __init__(self, interval: float, threshold: float) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self.stalls = 0
+        # Request task -> "METHOD /path", filled in by RouteTrackingMiddleware
+        self.routes: weakref.WeakKeyDictionary[asyncio.Task, str] = weakref.WeakKeyDictionary()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        # When the sampler is due to wake up (time.monotonic())
+        self._due = 0.0
+        self._sampler: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._due = time.monotonic() + self.interval
+        self._stop.clear()
+        self._sampler = asyncio.create_task(self._sample())
+        if self.threshold > 0:
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            try:
+                await self._sampler
+            except asyncio.CancelledError:
+                pass
+            self._sampler = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            self._due = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - self._due)
+            self.samples.append(lag)
+            if 0 < self.threshold < lag:
+                logger.warning("Event loop was blocked for %.0f ms in total", lag * 1000)
+
+    def _watch(self) -> None:
+        reported = None
+        while not self._stop.wait(self.threshold / 2):
+            due = self._due
+            blocked = time.monotonic() - due
+            if blocked <= self.threshold or due == reported:
+                continue
+            reported = due
+            self.stalls += 1
+            self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        task = asyncio.current_task(self._loop)
+        route = self.routes.get(task, "no request") if task is not None else "no task"
+        logger.warning(
+            "Event loop blocked for %.0f ms so far while serving %s; loop thread stack:\n%s",
+            blocked * 1000,
+            route,
+            stack,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Lag statistics over the recent samples, in milliseconds."""
+        samples = sorted(self.samples)
+        if not samples:
+            lag = {"last": None, "p50": None, "p99": None, "max": None}
+        else:
+            lag = {
+                "last": round(self.samples[-1] * 1000, 2),
+                "p50": round(statistics.median(samples) * 1000, 2),
+                "p99": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 2),
+                "max": round(samples[-1] * 1000, 2),
+            }
+        return {
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "samples": len(samples),
+            "lag_ms": lag,
+            "stalls": self.stalls,
+        }
+
+
+class RouteTrackingMiddleware:
+    """Pure ASGI middleware labelling each request's task for stall reports."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            task = asyncio.current_task()
+            if task is not None:
+                loop_monitor.routes[task] = f"{scope['method']} {scope['path']}"
+        await self.app(scope, receive, send)
+
+
+loop_monitor = LoopMonitor(
+    settings.LOOP_MONITOR_INTERVAL_SECONDS, settings.LOOP_BLOCK_THRESHOLD_SECONDS
+)
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PgListener:
+    """
+    One dedicated LISTEN connection per worker, shared by every channel.
+    It lives outside the pool so it never holds a pooled slot.
+    """
+
+    def __init__(self) -> None:
+        self._connection: asyncpg.Connection | None = None
+        self._callbacks: dict[str, Callable[[str], None]] = {}
+        self._lost_callbacks: list[Callable[[], None]] = []
+        self._lock = asyncio.Lock()
+
+    def register(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_lost: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Call `callback(payload)` for every notification on `channel`, and
+        `on_lost()` when the connection drops and notifications may be missed.
+        Channels must be registered before connecting.
+        """
+        self._callbacks[channel] = callback
+        if on_lost is not None:
+            self._lost_callbacks.append(on_lost)
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def connect(self) -> None:
+        """Open the connection and LISTEN on every channel, if not already."""
+        async with self._lock:
+            if self.listening:
+                return
+            dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+            connection = await asyncpg.connect(dsn.render_as_string(hide_password=False))
+            connection.add_termination_listener(self._on_terminated)
+            for channel, callback in self._callbacks.items():
+                await connection.add_listener(channel, self._dispatcher(callback))
+            self._connection = connection
+
+    def _dispatcher(self, callback: Callable[[str], None]) -> Callable[..., None]:
+        def dispatch(connection: Any, pid: int, channel: str, payload: str) -> None:
+            callback(payload)
+
+        return dispatch
+
+    def _on_terminated(self, connection: Any) -> None:
+        logger.warning("Notification listener connection lost")
+        self._connection = None
+        self._notify_lost()
+
+    def _notify_lost(self) -> None:
+        for on_lost in self._lost_callbacks:
+            on_lost()
+
+    async def close(self) -> None:
+        """
+        Close the connection on shutdown. The termination listener is removed
+        first, so this is not reported as a lost connection; subscribers are
+        still told their streams have ended.
+        """
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        connection.remove_termination_listener(self._on_terminated)
+        if not connection.is_closed():
+            await connection.close()
+        self._notify_lost()
+
+
+pg_listener = PgListener()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.database import bulk_engine
+from app.models.response import Response
+from app.models.survey import Survey
+from app.models.survey_config import SurveyConfig
+from app.services.rate_limit import prune_idle_buckets_statement
+
+logger = logging.getLogger(__name__)
+
+# Session-level advisory lock, so only one worker purges at a time
+PURGE_LOCK_KEY = 0x5355525645595055  # "SURVEYPU"
+
+
+async def _purge_survey(conn: AsyncConnection, survey_id: UUID, batch_size: int) -> int:
+    """Delete a survey's responses in batches, then the survey itself."""
+    deleted = 0
+    batch = select(Response.id).where(Response.survey_id == survey_id).limit(batch_size)
+
+    while True:
+        # Each batch commits on its own, keeping locks and cascades short
+        result = await conn.execute(
+            delete(Response).where(Response.survey_id == survey_id, Response.id.in_(batch))
+        )
+        await conn.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+
+    await conn.execute(
+        delete(Survey).where(Survey.id == survey_id, Survey.deleted_at.is_not(None))
+    )
+    await conn.commit()
+    return deleted
+
+
+async def _purge_orphan_configs(conn: AsyncConnection, retention: timedelta) -> int:
+    """
+    Delete config documents no survey references any more. Recently stored
+    configs are kept, since a survey being created may be about to use one.
+    """
+    result = await conn.execute(
+        delete(SurveyConfig).where(
+            SurveyConfig.created_at < func.now() - retention,
+            ~exists().where(Survey.config_hash == SurveyConfig.hash),
+        )
+    )
+    await conn.commit()
+    return result.rowcount
+
+
+async def _prune_rate_limit_buckets(conn: AsyncConnection) -> int:
+    """Delete autosave rate-limit buckets that have refilled completely."""
+    refill_time = timedelta(
+        seconds=settings.RESPOND_RATE_LIMIT_CAPACITY / settings.RESPOND_RATE_LIMIT_REFILL_PER_SECOND
+    )
+    result = await conn.execute(prune_idle_buckets_statement(refill_time))
+    await conn.commit()
+    return result.rowcount
+
+
+async def purge_deleted_surveys(
+    retention: timedelta | None = None, batch_size: int | None = None
+) -> int:
+    """
+    Hard-delete surveys soft-deleted longer ago than `retention`, with their
+    responses, and garbage-collect unreferenced configs and idle rate-limit
+    buckets. Returns the number of surveys purged; 0 if another worker holds
+    the purge lock.
+    """
+    if retention is None:
+        retention = timedelta(days=settings.SURVEY_PURGE_RETENTION_DAYS)
+    if batch_size is None:
+        batch_size = settings.SURVEY_PURGE_BATCH_SIZE
+
+    async with bulk_engine.connect() as conn:
+        locked = (await conn.execute(select(func.pg_try_advisory_lock(PURGE_LOCK_KEY)))).scalar()
+        await conn.commit()
+        if not locked:
+            return 0
+
+        try:
+            survey_ids = (
+                await conn.execute(
+                    select(Survey.id).where(Survey.deleted_at < func.now() - retention)
+                )
+            ).scalars().all()
+            await conn.commit()
+
+            for survey_id in survey_ids:
+                responses = await _purge_survey(conn, survey_id, batch_size)
+                logger.info("Purged survey %s with %d responses", survey_id, responses)
+
+            configs = await _purge_orphan_configs(conn, retention)
+            if configs:
+                logger.info("Purged %d unreferenced survey configs", configs)
+
+            buckets = await _prune_rate_limit_buckets(conn)
+            if buckets:
+                logger.info("Pruned %d idle rate-limit buckets", buckets)
+        finally:
+            await conn.execute(select(func.pg_advisory_unlock(PURGE_LOCK_KEY)))
+            await conn.commit()
+
+    return len(survey_ids)
+
+
+async def run_purger(interval: float) -> None:
+    """Purge on a fixed interval until cancelled, logging and surviving failures."""
+    while True:
+        try:
+            await purge_deleted_surveys()
+        except (OSError, SQLAlchemyError):
+            logger.warning("Survey purge failed", exc_info=True)
+        await asyncio.sleep(interval)
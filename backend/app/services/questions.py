@@ -0,0 +1,22 @@
+from collections.abc import Iterator
+from typing import Any
+
+QUESTION_TYPES = (
+    "scale_1_5",
+    "single_choice",
+    "multi_checkbox",
+    "dropdown",
+    "single_choice_with_text",
+    "open_text",
+)
+
+
+def iter_questions(config: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield every question of a survey config, in vector order."""
+    for vector in config.get("vectors", []):
+        yield from vector.get("questions", [])
+
+
+def question_map(config: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Map question_id to its question definition."""
+    return {question["question_id"]: question for question in iter_questions(config)}
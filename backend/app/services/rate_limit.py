@@ -0,0 +1,114 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import timedelta
+
+from sqlalchemy import Delete, Float, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.rate_limit import RateLimitBucket
+
+
+class TokenBucketLimiter(ABC):
+    """
+    Token bucket: each key holds up to `capacity` tokens, refilled at
+    `refill_per_second`. Every allowed request spends one token.
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+
+    @abstractmethod
+    async def acquire(self, db: AsyncSession, key: str) -> float:
+        """Spend a token for `key`. Returns 0 if allowed, else seconds until a token is available."""
+
+    def _wait_time(self, tokens: float) -> float:
+        return (1 - tokens) / self.refill_per_second
+
+
+class InMemoryTokenBucketLimiter(TokenBucketLimiter):
+    """Per-process buckets; correct for a single worker."""
+
+    # Least recently used buckets beyond this are dropped (treated as full)
+    MAX_KEYS = 100_000
+
+    def __init__(self, capacity: int, refill_per_second: float) -> None:
+        super().__init__(capacity, refill_per_second)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, db: AsyncSession, key: str) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) * self.refill_per_second)
+
+        allowed = tokens >= 1
+        self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+        if len(self._buckets) > self.MAX_KEYS:
+            self._buckets.popitem(last=False)
+
+        return 0.0 if allowed else self._wait_time(tokens)
+
+
+class PostgresTokenBucketLimiter(TokenBucketLimiter):
+    """
+    Buckets stored in rate_limit_buckets, shared by every worker. `acquire`
+    commits its own short transaction on `db`, so the bucket row is only
+    locked for the upsert; call it before the request starts writing.
+    Full buckets are pruned by the purger (see prune_idle_buckets_statement).
+    """
+
+    async def acquire(self, db: AsyncSession, key: str) -> float:
+        bucket = RateLimitBucket.__table__
+        refilled = func.least(
+            literal(self.capacity, Float),
+            bucket.c.tokens
+            + func.extract("epoch", func.now() - bucket.c.updated_at)
+            * literal(self.refill_per_second, Float),
+        )
+
+        # Refill and spend atomically; the WHERE skips the update when empty
+        stmt = pg_insert(RateLimitBucket).values(
+            key=key, tokens=self.capacity - 1, updated_at=func.now()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={"tokens": refilled - 1, "updated_at": func.now()},
+            where=refilled >= 1,
+        ).returning(RateLimitBucket.tokens)
+
+        if (await db.execute(stmt)).first() is not None:
+            await db.commit()
+            return 0.0
+
+        tokens = (await db.execute(select(refilled).where(bucket.c.key == key))).scalar_one()
+        await db.commit()
+        return self._wait_time(tokens)
+
+
+def prune_idle_buckets_statement(idle: timedelta) -> Delete:
+    """
+    Delete buckets untouched for `idle`. Once that is at least the refill
+    time they are full again, the same as having no row.
+    """
+    return delete(RateLimitBucket).where(RateLimitBucket.updated_at < func.now() - idle)
+
+
+def create_respond_rate_limiter() -> TokenBucketLimiter | None:
+    """Build the autosave limiter selected by RESPOND_RATE_LIMIT_BACKEND."""
+    limiters = {
+        "memory": InMemoryTokenBucketLimiter,
+        "postgres": PostgresTokenBucketLimiter,
+    }
+    limiter_class = limiters.get(settings.RESPOND_RATE_LIMIT_BACKEND)
+    if limiter_class is None:
+        return None
+    return limiter_class(
+        settings.RESPOND_RATE_LIMIT_CAPACITY,
+        settings.RESPOND_RATE_LIMIT_REFILL_PER_SECOND,
+    )
+
+
+respond_rate_limiter = create_respond_rate_limiter()
@@ -0,0 +1,493 @@
+import codecs
+import csv
+import heapq
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    delete,
+    false,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from app.models.response import Response
+from app.models.user import User
+from app.services.answers import typed_answer_rows, write_typed_answers
+from app.services.export import METADATA_COLUMNS
+from app.services.questions import question_map
+from app.services.search import search_vector, searchable_text
+from app.utils.hashing import content_hash
+
+# Longest line (or quoted CSV record) buffered while parsing an upload
+MAX_IMPORT_LINE_BYTES = 1024 * 1024
+
+# Errors listed in the report; the rest are only counted
+MAX_IMPORT_ERRORS = 1000
+
+# Responses per executemany of their typed answers
+TYPED_ANSWER_BATCH_SIZE = 1000
+
+# Staging table for one import; dropped when the transaction ends
+import_rows = Table(
+    "response_import",
+    MetaData(),
+    Column("upload_row", Integer, primary_key=True, autoincrement=False),
+    Column("id", PGUUID(as_uuid=True), nullable=False),
+    Column("github_username", String(255), nullable=False),
+    Column("user_id", PGUUID(as_uuid=True)),
+    Column("answers", JSONB, nullable=False),
+    Column("answers_hash", String(64), nullable=False),
+    Column("search_text", Text, nullable=False),
+    Column("submitted_at", DateTime(timezone=True), nullable=False),
+    # The response the row was merged into
+    Column("response_id", PGUUID(as_uuid=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+COPY_COLUMNS = ("upload_row", "id", "github_username", "answers", "answers_hash", "search_text", "submitted_at")
+
+
+def validate_answer(question: dict[str, Any], value: Any) -> Any:
+    """
+    Check an answer against its question definition and return it in the
+    form the survey form stores. Raises ValueError.
+    """
+    question_id = question["question_id"]
+    question_type = question["type"]
+    options = question.get("options") or []
+
+    def check_option(choice: Any) -> None:
+        if not isinstance(choice, str) or (options and choice not in options):
+            raise ValueError(f"{choice!r} is not an option of {question_id}")
+
+    if question_type == "scale_1_5":
+        if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= 5:
+            raise ValueError(f"{question_id} takes a number from 1 to 5")
+    elif question_type == "multi_checkbox":
+        if not isinstance(value, list):
+            raise ValueError(f"{question_id} takes a list of options")
+        for choice in value:
+            check_option(choice)
+        if len(set(value)) != len(value):
+            raise ValueError(f"{question_id} has an option selected twice")
+    elif question_type == "single_choice_with_text":
+        # The form always writes {"choice", "text"}; a bare choice is normalized to it
+        if not isinstance(value, dict):
+            value = {"choice": value}
+        check_option(value.get("choice"))
+        if not isinstance(value.get("text", ""), str) or set(value) - {"choice", "text"}:
+            raise ValueError(f"{question_id} takes a choice and an optional text")
+        value = {"choice": value["choice"], "text": value.get("text", "")}
+    elif question_type in ("single_choice", "dropdown"):
+        check_option(value)
+    elif not isinstance(value, str):
+        raise ValueError(f"{question_id} takes text")
+    return value
+
+
+def parse_cell(question: dict[str, Any], text: str) -> Any:
+    """
+    A CSV cell as an answer, in the format the CSV export writes: numbers
+    for scales, JSON for lists and choice-with-text objects. Multi-select
+    cells may also list options separated by ";". Empty cells are None.
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    question_type = question["type"]
+    if question_type == "scale_1_5":
+        try:
+            return int(text)
+        except ValueError:
+            raise ValueError(f"{question['question_id']} takes a number from 1 to 5") from None
+    if question_type == "multi_checkbox":
+        if text.startswith("["):
+            return _json_cell(question, text)
+        return [choice.strip() for choice in text.split(";") if choice.strip()]
+    if question_type == "single_choice_with_text" and text.startswith("{"):
+        return _json_cell(question, text)
+    return text
+
+
+def _json_cell(question: dict[str, Any], text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        raise ValueError(f"{question['question_id']} is not valid JSON") from None
+
+
+def parse_submitted_at(value: Any) -> datetime:
+    """An ISO 8601 submission time (UTC if no offset is given), defaulting to now."""
+    if value in (None, ""):
+        return datetime.now(timezone.utc)
+    if not isinstance(value, str):
+        raise ValueError("submitted_at must be an ISO 8601 timestamp")
+    try:
+        submitted_at = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError("submitted_at must be an ISO 8601 timestamp") from None
+    if submitted_at.tzinfo is None:
+        submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+    if submitted_at > datetime.now(timezone.utc):
+        raise ValueError("submitted_at is in the future")
+    return submitted_at
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a UTF-8 byte stream (BOM allowed) into lines, ends kept."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            lines = (pending + decoder.decode(chunk)).split("\n")
+            # The last piece is an unfinished line (or empty)
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+            if len(pending) > MAX_IMPORT_LINE_BYTES:
+                raise ValueError("Upload has a line longer than 1 MiB")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValueError("Upload is not valid UTF-8") from None
+    if pending:
+        yield pending
+
+
+async def csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict[str, str]]]:
+    """(row number, record) for every CSV data row; the header is row 1."""
+    header: list[str] | None = None
+    record = ""
+    row = 0
+
+    async for line in iter_lines(chunks):
+        record += line
+        # A quoted field may span lines; a record ends where quotes balance
+        if record.count('"') % 2:
+            if len(record) > MAX_IMPORT_LINE_BYTES:
+                raise ValueError("Upload has a record longer than 1 MiB")
+            continue
+        row += 1
+        fields = next(csv.reader([record]), [])
+        record = ""
+
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if fields:
+            yield row, dict(zip(header, fields))
+
+    if record:
+        raise ValueError("Upload ends inside a quoted field")
+    if header is None:
+        raise ValueError("Upload is empty")
+
+
+async def ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Any]]:
+    """(line number, decoded value) for every non-empty NDJSON line."""
+    row = 0
+    async for line in iter_lines(chunks):
+        row += 1
+        if line.strip():
+            try:
+                yield row, json.loads(line)
+            except json.JSONDecodeError:
+                yield row, None
+
+
+def csv_answers(questions: dict[str, dict[str, Any]], record: dict[str, str]) -> dict[str, Any]:
+    answers = {}
+    for column, text in record.items():
+        if column in METADATA_COLUMNS:
+            continue
+        question = questions.get(column)
+        if question is None:
+            raise ValueError(f"Unknown question column: {column}")
+        value = parse_cell(question, text or "")
+        if value is not None:
+            answers[column] = value
+    return answers
+
+
+def check_header(questions: dict[str, dict[str, Any]], record: dict[str, str]) -> None:
+    """Reject a CSV whose columns cannot be imported at all."""
+    if "github_username" not in record:
+        raise ValueError("CSV header must include github_username")
+    unknown = [column for column in record if column not in METADATA_COLUMNS and column not in questions]
+    if unknown:
+        raise ValueError(f"Unknown question columns: {', '.join(unknown)}")
+
+
+class ResponseImport:
+    """
+    One import of submitted responses into a survey, keyed by GitHub username.
+
+    Rows are parsed and validated as the upload streams in and copied into
+    a temporary staging table with a single COPY. Respondents are then
+    resolved, and responses merged, with a handful of set-based statements.
+    """
+
+    def __init__(self, db: AsyncSession, survey_id: UUID, config: dict[str, Any]) -> None:
+        self.db = db
+        self.survey_id = survey_id
+        self.config = config
+        self.questions = question_map(config)
+        self.received = 0
+        self.error_count = 0
+        # Per source, each in row order and capped; merged for the report
+        self._error_lists: list[list[dict[str, Any]]] = []
+        self._errors: list[dict[str, Any]] = []
+        self._fatal: ValueError | None = None
+
+    def _reject(self, row: int, github_username: Any, error: str) -> None:
+        self.error_count += 1
+        if len(self._errors) < MAX_IMPORT_ERRORS:
+            username = github_username if isinstance(github_username, str) else None
+            self._errors.append({"row": row, "github_username": username, "error": error})
+
+    def _end_error_source(self) -> None:
+        self._error_lists.append(self._errors)
+        self._errors = []
+
+    def _staged_row(self, row: int, github_username: Any, answers: Any, extra: dict[str, Any]) -> tuple:
+        """A COPY record for a valid row. Raises ValueError."""
+        if not isinstance(github_username, str) or not github_username.strip():
+            raise ValueError("github_username is required")
+        if str(extra.get("is_draft", "")).lower() == "true" or extra.get("is_draft") is True:
+            raise ValueError("Drafts are not imported")
+        if not isinstance(answers, dict):
+            raise ValueError("answers must be an object")
+        validated = {}
+        for question_id, value in answers.items():
+            question = self.questions.get(question_id)
+            if question is None:
+                raise ValueError(f"Unknown question: {question_id}")
+            validated[question_id] = validate_answer(question, value)
+        return (
+            row,
+            uuid4(),
+            github_username.strip(),
+            json.dumps(validated),
+            content_hash(validated),
+            searchable_text(self.config, validated),
+            parse_submitted_at(extra.get("submitted_at")),
+        )
+
+    async def _staged_rows(self, format: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple]:
+        """Valid rows of the upload; invalid ones are reported and skipped."""
+        try:
+            if format == "csv":
+                checked = False
+                async for row, record in csv_records(chunks):
+                    if not checked:
+                        check_header(self.questions, record)
+                        checked = True
+                    self.received += 1
+                    username = record.get("github_username")
+                    try:
+                        yield self._staged_row(row, username, csv_answers(self.questions, record), record)
+                    except ValueError as error:
+                        self._reject(row, username, str(error))
+            else:
+                async for row, record in ndjson_records(chunks):
+                    self.received += 1
+                    if not isinstance(record, dict):
+                        self._reject(row, None, "Line is not a JSON object")
+                        continue
+                    username = record.get("github_username")
+                    try:
+                        yield self._staged_row(row, username, record.get("answers"), record)
+                    except ValueError as error:
+                        self._reject(row, username, str(error))
+        except ValueError as error:
+            # Ends the COPY cleanly; raised once it has finished
+            self._fatal = error
+
+    async def _reject_staged(self, stmt: Any, error: str) -> None:
+        """Report the staged rows (upload_row, github_username) a statement returns."""
+        result = await self.db.execute(stmt)
+        for staged in sorted(result.all()):
+            self._reject(staged.upload_row, staged.github_username, error)
+        self._end_error_source()
+
+    async def run(self, format: str, chunks: AsyncIterator[bytes]) -> dict[str, Any]:
+        """Import the upload in the session's transaction; the caller commits."""
+        await self.db.execute(CreateTable(import_rows))
+        connection = await (await self.db.connection()).get_raw_connection()
+        await connection.driver_connection.copy_records_to_table(
+            import_rows.name, records=self._staged_rows(format, chunks), columns=COPY_COLUMNS
+        )
+        if self._fatal is not None:
+            raise self._fatal
+        self._end_error_source()
+
+        # Resolve respondents set-wise: exact usernames first, then, since GitHub
+        # usernames are case-insensitive, a case variant matching a single user
+        staged = import_rows.c
+        await self.db.execute(
+            update(import_rows)
+            .values(user_id=User.id)
+            .where(User.github_username == staged.github_username)
+        )
+        case_variants = (
+            select(func.count())
+            .where(func.lower(User.github_username) == func.lower(staged.github_username))
+            .scalar_subquery()
+        )
+        await self._reject_staged(
+            delete(import_rows)
+            .where(staged.user_id.is_(None), case_variants > 1)
+            .returning(staged.upload_row, staged.github_username),
+            "GitHub username matches several users when case is ignored",
+        )
+        await self.db.execute(
+            update(import_rows)
+            .values(user_id=User.id)
+            .where(
+                staged.user_id.is_(None),
+                func.lower(User.github_username) == func.lower(staged.github_username),
+            )
+        )
+        await self._reject_staged(
+            delete(import_rows)
+            .where(staged.user_id.is_(None))
+            .returning(staged.upload_row, staged.github_username),
+            "Unknown GitHub user",
+        )
+
+        ranked = select(
+            staged.upload_row,
+            func.row_number().over(partition_by=staged.user_id, order_by=staged.upload_row).label("rank"),
+        ).subquery()
+        await self._reject_staged(
+            delete(import_rows)
+            .where(staged.upload_row == ranked.c.upload_row, ranked.c.rank > 1)
+            .returning(staged.upload_row, staged.github_username),
+            "Respondent appears earlier in the upload",
+        )
+        await self._reject_staged(
+            delete(import_rows)
+            .where(
+                Response.survey_id == self.survey_id,
+                Response.user_id == staged.user_id,
+                Response.is_draft.is_(False),
+            )
+            .returning(staged.upload_row, staged.github_username),
+            "Respondent has already submitted a response",
+        )
+
+        merged = (await self.db.execute(merge_statement(self.survey_id))).all()
+
+        # A respondent who submitted concurrently keeps their own response
+        await self._reject_staged(
+            select(staged.upload_row, staged.github_username).where(staged.response_id.is_(None)),
+            "Respondent has already submitted a response",
+        )
+
+        for start in range(0, len(merged), TYPED_ANSWER_BATCH_SIZE):
+            await write_typed_answers(
+                self.db,
+                [
+                    row
+                    for response in merged[start : start + TYPED_ANSWER_BATCH_SIZE]
+                    for row in typed_answer_rows(self.questions, self.survey_id, response.id, response.answers)
+                ],
+            )
+
+        errors = list(heapq.merge(*self._error_lists, key=lambda error: error["row"]))
+        return {
+            "received": self.received,
+            "imported": len(merged),
+            "error_count": self.error_count,
+            "errors": errors[:MAX_IMPORT_ERRORS],
+        }
+
+
+def merge_statement(survey_id: UUID) -> Any:
+    """
+    Insert the staged rows as submitted responses in one statement; an
+    existing draft is finalized with the imported answers, an existing
+    submission is left alone. Merged rows get their response_id in the
+    staging table, and the merged responses are returned.
+    """
+    staged = import_rows.c
+    stmt = pg_insert(Response).from_select(
+        [
+            "id",
+            "survey_id",
+            "user_id",
+            "answers",
+            "answers_hash",
+            "is_draft",
+            "revision",
+            "search_vector",
+            "submitted_at",
+            "created_at",
+            "updated_at",
+        ],
+        select(
+            staged.id,
+            literal(survey_id, Response.survey_id.type),
+            staged.user_id,
+            staged.answers,
+            staged.answers_hash,
+            false(),
+            literal(1),
+            search_vector(staged.search_text),
+            staged.submitted_at,
+            func.now(),
+            func.now(),
+        ).order_by(staged.upload_row),
+    )
+    merged = stmt.on_conflict_do_update(
+        index_elements=[Response.survey_id, Response.user_id],
+        set_={
+            "answers": stmt.excluded.answers,
+            "answers_hash": stmt.excluded.answers_hash,
+            "is_draft": stmt.excluded.is_draft,
+            "revision": Response.revision + 1,
+            "search_vector": stmt.excluded.search_vector,
+            "submitted_at": stmt.excluded.submitted_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=Response.is_draft.is_(True),
+    ).returning(Response.id, Response.user_id, Response.answers).cte("merged")
+
+    return (
+        update(import_rows)
+        .values(response_id=merged.c.id)
+        .where(staged.user_id == merged.c.user_id)
+        .returning(merged.c.id, merged.c.answers)
+    )
+
+
+async def import_responses(
+    db: AsyncSession,
+    survey_id: UUID,
+    config: dict[str, Any],
+    chunks: AsyncIterator[bytes],
+    format: str,
+) -> dict[str, Any]:
+    """
+    Import submitted responses from a CSV or NDJSON byte stream and return
+    the report. Raises ValueError for uploads that cannot be read at all.
+    """
+    return await ResponseImport(db, survey_id, config).run(format, chunks)
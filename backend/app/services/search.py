@@ -0,0 +1,52 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal
+
+from app.models.response import Response
+from app.services.questions import iter_questions
+
+# Text search configuration used for indexing, queries and snippets alike
+SEARCH_LANGUAGE = "english"
+
+
+def searchable_questions(config: dict[str, Any]) -> list[dict[str, Any]]:
+    """Questions with free-text answers: open_text and the text of choice-with-text."""
+    return [
+        question
+        for question in iter_questions(config)
+        if question["type"] in ("open_text", "single_choice_with_text")
+    ]
+
+
+def searchable_text(config: dict[str, Any], answers: dict[str, Any]) -> str:
+    """The free text of a response, as indexed in search_vector."""
+    parts = []
+    for question in searchable_questions(config):
+        answer = answers.get(question["question_id"])
+        if question["type"] == "single_choice_with_text":
+            answer = answer.get("text") if isinstance(answer, dict) else None
+        if isinstance(answer, str) and answer:
+            parts.append(answer)
+    return " ".join(parts)
+
+
+def searchable_text_expression(config: dict[str, Any]) -> ColumnElement:
+    """searchable_text computed in SQL from Response.answers, for snippets and backfills."""
+    parts = []
+    for question in searchable_questions(config):
+        answer = Response.answers[question["question_id"]]
+        if question["type"] == "single_choice_with_text":
+            parts.append(answer["text"].astext)
+        else:
+            parts.append(answer.astext)
+    # concat_ws skips NULLs, i.e. unanswered questions
+    return func.concat_ws(" ", *parts) if parts else literal("")
+
+
+def search_vector(text: str | ColumnElement) -> ColumnElement:
+    return func.to_tsvector(SEARCH_LANGUAGE, text)
+
+
+def search_query(q: str) -> ColumnElement:
+    """A user search string (quotes, OR and -exclusions allowed) as a tsquery."""
+    return func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
@@ -0,0 +1,175 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import Select, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.survey import Survey
+from app.models.survey_config import SurveyConfig
+from app.services.notifications import pg_listener
+
+SURVEY_CHANNEL = "survey_changes"
+
+# Config documents kept per worker; they are immutable, so never invalidated
+CONFIG_CACHE_SIZE = 256
+
+# Minimum seconds between reconnect attempts while the listener is down
+RECONNECT_INTERVAL = 5.0
+
+
+@dataclass(frozen=True)
+class CachedSurvey:
+    """The survey fields read on the respondent paths (everything except the config)."""
+
+    id: UUID
+    slug: str
+    title: str
+    description: str | None
+    config_hash: str
+    opens_at: datetime | None
+    closes_at: datetime | None
+    updated_at: datetime
+
+
+def live_surveys_statement() -> Select:
+    """The cached fields of live (not deleted) surveys."""
+    return select(
+        Survey.id,
+        Survey.slug,
+        Survey.title,
+        Survey.description,
+        Survey.config_hash,
+        Survey.opens_at,
+        Survey.closes_at,
+        Survey.updated_at,
+    ).where(Survey.deleted_at.is_(None))
+
+
+def survey_by_slug_statement(slug: str) -> Select:
+    """Load a live survey's cached fields by slug."""
+    return live_surveys_statement().where(Survey.slug == slug)
+
+
+def survey_changed_statement(*conditions: Any) -> Select:
+    """
+    Announce changes to the surveys matching `conditions` to every worker's
+    cache, returning their slugs. Like any NOTIFY, it is only delivered if
+    the transaction commits.
+    """
+    return select(Survey.slug, func.pg_notify(SURVEY_CHANNEL, Survey.slug)).where(*conditions)
+
+
+def slug_changed_statement(slug: str) -> Select:
+    """Announce a change to one slug, e.g. one that did not exist before."""
+    return select(func.pg_notify(SURVEY_CHANNEL, literal(slug)))
+
+
+class SurveyCache:
+    """
+    Bounded LRU of slug -> live survey (None for unknown or deleted slugs)
+    and of config hash -> config. Survey entries are invalidated by
+    notifications on SURVEY_CHANNEL, so the cache is only consulted while
+    the worker's listener is connected; otherwise every lookup goes to the
+    database. Writers also invalidate their slugs here right after
+    committing, so this worker never serves a survey older than a write it
+    has answered; other workers catch up when the notification arrives.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._surveys: OrderedDict[str, CachedSurvey | None] = OrderedDict()
+        self._configs: OrderedDict[str, dict] = OrderedDict()
+        # Bumped on every invalidation; a lookup that raced one is not stored
+        self._generation = 0
+        self._last_reconnect = 0.0
+        pg_listener.register(SURVEY_CHANNEL, self.invalidate, on_lost=self.clear)
+
+    def invalidate(self, slug: str) -> None:
+        self._generation += 1
+        self._surveys.pop(slug, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._surveys.clear()
+
+    async def _usable(self) -> bool:
+        if self.max_entries <= 0:
+            return False
+        if pg_listener.listening:
+            return True
+
+        now = time.monotonic()
+        if now - self._last_reconnect < RECONNECT_INTERVAL:
+            return False
+        self._last_reconnect = now
+        try:
+            await pg_listener.connect()
+        except (OSError, asyncpg.PostgresError):
+            return False
+        # Changes may have been missed while disconnected
+        self.clear()
+        return True
+
+    def _store(self, slug: str, survey: CachedSurvey | None) -> None:
+        self._surveys[slug] = survey
+        self._surveys.move_to_end(slug)
+        if len(self._surveys) > self.max_entries:
+            self._surveys.popitem(last=False)
+
+    async def get(self, db: AsyncSession, slug: str) -> CachedSurvey | None:
+        """The live survey with this slug, or None if it does not exist or was deleted."""
+        usable = await self._usable()
+        if usable and slug in self._surveys:
+            self._surveys.move_to_end(slug)
+            return self._surveys[slug]
+
+        generation = self._generation
+        row = (await db.execute(survey_by_slug_statement(slug))).one_or_none()
+        survey = CachedSurvey(**row._mapping) if row is not None else None
+
+        if usable and generation == self._generation:
+            self._store(slug, survey)
+        return survey
+
+    async def config(self, db: AsyncSession, config_hash: str) -> dict:
+        """A config document by hash; safe to cache since configs never change."""
+        config = self._configs.get(config_hash)
+        if config is None:
+            config = (
+                await db.execute(
+                    select(SurveyConfig.config).where(SurveyConfig.hash == config_hash)
+                )
+            ).scalar_one()
+            self._configs[config_hash] = config
+            if len(self._configs) > CONFIG_CACHE_SIZE:
+                self._configs.popitem(last=False)
+        else:
+            self._configs.move_to_end(config_hash)
+        return config
+
+    async def warm(self, db: AsyncSession) -> None:
+        """Preload the surveys that are currently open, up to the cache size."""
+        if not await self._usable():
+            return
+
+        generation = self._generation
+        result = await db.execute(
+            live_surveys_statement()
+            .where(
+                or_(Survey.opens_at.is_(None), Survey.opens_at <= func.now()),
+                or_(Survey.closes_at.is_(None), Survey.closes_at > func.now()),
+            )
+            .limit(self.max_entries)
+        )
+        if generation == self._generation:
+            for row in result:
+                self._store(row.slug, CachedSurvey(**row._mapping))
+
+
+survey_cache = SurveyCache(settings.SURVEY_CACHE_SIZE)
@@ -0,0 +1,18 @@
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models.survey_config import SurveyConfig
+from app.utils.hashing import content_hash
+
+
+async def store_config(db: AsyncSession | AsyncConnection, config: dict[str, Any]) -> str:
+    """Store a config document unless an identical one exists, and return its hash."""
+    config_hash = content_hash(config)
+    await db.execute(
+        pg_insert(SurveyConfig)
+        .values(hash=config_hash, config=config)
+        .on_conflict_do_nothing(index_elements=[SurveyConfig.hash])
+    )
+    return config_hash
@@ -0,0 +1,92 @@
+import random
+from typing import Any
+
+from app.services.questions import QUESTION_TYPES, iter_questions
+
+_WORDS = (
+    "python pandas numpy sql statistics visualization teamwork deadline "
+    "machine learning healthcare dataset notebook git review schedule "
+    "evening weekend project presentation modeling cleaning analysis"
+).split()
+
+_OPTION_SETS = (
+    ["Yes", "No"],
+    ["<3", "3-5", "5-8", "8-12", "12+"],
+    ["Weekday mornings", "Weekday afternoons", "Weekday evenings", "Weekend mornings", "Weekend afternoons", "Weekend evenings"],
+    ["I prefer to finish well ahead of time", "I work steadily and finish on time", "I tend to work best closer to the deadline"],
+    ["A (high achievement is a priority)", "B (solid performance, balanced with other commitments)", "Pass (completing requirements is my main goal)"],
+)
+
+
+def generate_config(
+    rng: random.Random, vectors: int = 3, questions_per_vector: int = 6
+) -> dict[str, Any]:
+    """Generate a survey config shaped like the course pairing surveys."""
+    config_vectors = []
+    number = 1
+
+    for v in range(vectors):
+        questions = []
+        for _ in range(questions_per_vector):
+            question_type = QUESTION_TYPES[(number - 1) % len(QUESTION_TYPES)]
+            question: dict[str, Any] = {
+                "question_id": f"Q{number}",
+                "question": f"Synthetic question {number}?",
+                "type": question_type,
+            }
+            if question_type not in ("scale_1_5", "open_text"):
+                question["options"] = list(rng.choice(_OPTION_SETS))
+            if question_type == "single_choice_with_text":
+                question["text_prompt"] = "If yes, please describe:"
+            questions.append(question)
+            number += 1
+
+        config_vectors.append(
+            {
+                "vector_id": f"vector_{v + 1}",
+                "vector_name": f"Vector {v + 1}",
+                "pairing_strategy": "match" if v % 2 else "complement",
+                "questions": questions,
+            }
+        )
+
+    return {
+        "survey_title": "Synthetic Survey",
+        "description": "Generated survey for benchmarks and local load testing.",
+        "vectors": config_vectors,
+    }
+
+
+def _sentence(rng: random.Random, max_words: int = 20) -> str:
+    return " ".join(rng.choices(_WORDS, k=rng.randint(3, max_words)))
+
+
+def generate_answer(rng: random.Random, question: dict[str, Any]) -> Any:
+    """Generate a type-correct answer for a single question."""
+    question_type = question["type"]
+    options = question.get("options", [])
+
+    if question_type == "scale_1_5":
+        return rng.randint(1, 5)
+    if question_type in ("single_choice", "dropdown"):
+        return rng.choice(options)
+    if question_type == "multi_checkbox":
+        return rng.sample(options, rng.randint(1, len(options)))
+    if question_type == "single_choice_with_text":
+        return {"choice": rng.choice(options), "text": _sentence(rng)}
+    return _sentence(rng, max_words=60)
+
+
+def generate_answers(
+    rng: random.Random, config: dict[str, Any], completeness: float = 1.0
+) -> dict[str, Any]:
+    """
+    Generate answers for a survey config.
+    completeness is the probability that each question is answered,
+    so values below 1.0 produce realistic partial drafts.
+    """
+    return {
+        question["question_id"]: generate_answer(rng, question)
+        for question in iter_questions(config)
+        if completeness >= 1.0 or rng.random() < completeness
+    }
@@ -0,0 +1,43 @@
+import asyncio
+from uuid import UUID
+
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.services.notifications import pg_listener
+from app.services.survey_cache import survey_by_slug_statement, survey_cache
+from app.utils.security import user_by_id_statement
+
+# Placeholder parameters that match no row
+_NIL_UUID = UUID(int=0)
+
+
+async def _prime_connection() -> None:
+    """
+    Check out one pooled connection and run the per-request lookups on it
+    with placeholder parameters, so the driver's prepared-statement cache
+    for that connection already holds them.
+    """
+    async with engine.connect() as connection:
+        await connection.execute(user_by_id_statement(_NIL_UUID))
+        await connection.execute(survey_by_slug_statement(""))
+        await connection.rollback()
+
+
+async def warm_up_database(connections: int | None = None) -> None:
+    """
+    Open `connections` pool connections concurrently and prepare the
+    authentication and survey lookups on each, so the first requests after
+    startup skip connection setup and statement parsing. (The autosave
+    upsert is left out: it can only be prepared by running it.)
+    Also fills the survey cache with the surveys that are open.
+    """
+    if connections is None:
+        connections = settings.DB_WARMUP_CONNECTIONS
+    connections = min(connections, settings.DB_POOL_SIZE)
+
+    await asyncio.gather(*(_prime_connection() for _ in range(connections)))
+
+    # Start listening for cache invalidations, then preload the open surveys
+    await pg_listener.connect()
+    async with AsyncSessionLocal() as session:
+        await survey_cache.warm(session)
@@ -0,0 +1,12 @@
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(value: Any) -> str:
+    """
+    SHA-256 hex digest of a JSON value in canonical form (sorted keys,
+    no insignificant whitespace), so equal documents hash equally.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -36,6 +36,11 @@ def decode_access_token(token: str) -> UUID | None:
         return None
 
 
+def user_by_id_statement(user_id: UUID) -> Select:
+    """Load a user by primary key (the per-request authentication lookup)."""
+    return select(User).where(User.id == user_id)
+
+
 async def get_current_user(
     request: Request, db: AsyncSession = Depends(get_db)
 ) -> User:
@@ -57,8 +62,10 @@ async def get_current_user(
             detail="Invalid or expired token",
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(user_by_id_statement(user_id))
     user = result.scalar_one_or_none()
+    # Return the connection to the respondent pool; admin handlers run on their own
+    await db.commit()
 
     if user is None:
         raise HTTPException(
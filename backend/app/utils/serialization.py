@@ -0,0 +1,33 @@
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+from app.config import settings
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded by orjson.
+    UUIDs and datetimes are encoded natively, and asyncpg's own UUID type
+    through str; UTC datetimes use the "Z" suffix so output matches what
+    Pydantic produces.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_UTC_Z)
+
+
+def rows_response(rows: list[dict[str, Any]]) -> Any:
+    """
+    Return plain row dicts from a list endpoint.
+
+    With FAST_JSON_RESPONSES enabled the rows are encoded straight to bytes,
+    skipping response_model validation since their shape is already known.
+    Otherwise FastAPI validates and serializes them as usual.
+    """
+    if settings.FAST_JSON_RESPONSES:
+        return FastJSONResponse(rows)
+    return rows
@@ -0,0 +1,133 @@
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from httpx import AsyncClient
+
+from app.config import settings
+from app.services.synthetic import generate_answers
+from app.utils.security import create_access_token
+from benchmarks.seed import SeededSurvey
+
+API_PREFIX = "/api/v1"
+
+RequestFactory = Callable[[AsyncClient, int], Awaitable[int]]
+
+
+def summarize(
+    latencies: list[float], errors: int, rate_limited: int, elapsed: float
+) -> dict[str, Any]:
+    """Reduce raw latencies (seconds) to throughput and percentiles in milliseconds."""
+    if not latencies:
+        return {
+            "requests": 0,
+            "errors": errors,
+            "rate_limited": rate_limited,
+            "elapsed_s": round(elapsed, 3),
+        }
+
+    ordered = sorted(latencies)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+
+    def ms(value: float) -> float:
+        return round(value * 1000, 3)
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rate_limited": rate_limited,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else None,
+        "mean_ms": ms(statistics.fmean(ordered)),
+        "p50_ms": ms(cuts[49]),
+        "p90_ms": ms(cuts[89]),
+        "p95_ms": ms(cuts[94]),
+        "p99_ms": ms(cuts[98]),
+        "max_ms": ms(ordered[-1]),
+    }
+
+
+async def drive(
+    client: AsyncClient,
+    make_request: RequestFactory,
+    total: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """
+    Issue `total` requests from `concurrency` workers and record latencies.
+    429s are counted apart and left out of the latencies: a cheap rejection
+    would otherwise inflate throughput.
+    """
+    latencies: list[float] = []
+    errors = 0
+    rate_limited = 0
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors, rate_limited
+        for n in counter:
+            started = time.perf_counter()
+            try:
+                status_code = await make_request(client, n)
+            except Exception:
+                status_code = 0
+            if status_code == 429:
+                rate_limited += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if status_code >= 400 or status_code == 0:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, rate_limited, time.perf_counter() - started)
+
+
+def autosave_scenario(seeded: SeededSurvey, seed: int) -> RequestFactory:
+    """Draft saves spread over the fresh respondents, as the frontend autosave sends them."""
+    rng = random.Random(seed)
+    tokens = [create_access_token(user_id) for user_id in seeded.respondent_ids]
+    url = f"{API_PREFIX}/surveys/{seeded.slug}/respond"
+
+    async def make_request(client: AsyncClient, n: int) -> int:
+        response = await client.post(
+            url,
+            json={"answers": generate_answers(rng, seeded.config, 0.5), "is_draft": True},
+            headers={"Cookie": f"{settings.JWT_COOKIE_NAME}={tokens[n % len(tokens)]}"},
+        )
+        return response.status_code
+
+    return make_request
+
+
+def public_config_scenario(seeded: SeededSurvey) -> RequestFactory:
+    """Anonymous fetches of the survey config used to render the form."""
+    url = f"{API_PREFIX}/surveys/{seeded.slug}/public"
+
+    async def make_request(client: AsyncClient, n: int) -> int:
+        response = await client.get(url)
+        return response.status_code
+
+    return make_request
+
+
+def export_scenario(seeded: SeededSurvey, export_format: str) -> RequestFactory:
+    """Admin exports, consuming the whole body so streaming cost is measured."""
+    token = create_access_token(seeded.admin_id)
+    url = f"{API_PREFIX}/surveys/{seeded.survey_id}/export"
+
+    async def make_request(client: AsyncClient, n: int) -> int:
+        async with client.stream(
+            "GET",
+            url,
+            params={"format": export_format},
+            headers={"Cookie": f"{settings.JWT_COOKIE_NAME}={token}"},
+        ) as response:
+            async for _ in response.aiter_bytes():
+                pass
+            return response.status_code
+
+    return make_request
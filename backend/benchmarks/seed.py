@@ -0,0 +1,57 @@
+import random
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.cli.seed import create_survey, create_users, load_responses
+from app.database import Base
+from app.models.user import User
+
+
+@dataclass
+class SeededSurvey:
+    """Identifiers of the data created for one benchmark size."""
+
+    survey_id: UUID
+    slug: str
+    config: dict
+    admin_id: UUID
+    respondent_ids: list[UUID] = field(default_factory=list)
+
+
+async def reset_schema(engine: AsyncEngine) -> None:
+    """Drop and recreate all tables in the benchmark database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def seed_survey(
+    engine: AsyncEngine,
+    rng: random.Random,
+    config: dict,
+    responses: int,
+    respondents: int,
+    submitted_ratio: float = 0.7,
+) -> SeededSurvey:
+    """
+    Create an admin, a survey, `responses` users with existing responses
+    and `respondents` fresh users that the autosave scenario writes as.
+    """
+    async with engine.begin() as conn:
+        survey_id, slug = await create_survey(conn, rng, config, "bench-admin")
+        admin_id = (
+            await conn.execute(select(User.id).where(User.github_username == "bench-admin"))
+        ).scalar_one()
+        await load_responses(conn, rng, survey_id, config, responses, submitted_ratio)
+        respondent_ids = await create_users(conn, rng, respondents)
+
+    return SeededSurvey(
+        survey_id=survey_id,
+        slug=slug,
+        config=config,
+        admin_id=admin_id,
+        respondent_ids=respondent_ids,
+    )
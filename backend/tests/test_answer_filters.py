@@ -0,0 +1,89 @@
+import pytest
+
+from app.services.answer_filters import parse_answer_filters
+from app.services.questions import question_map
+from app.utils.security import create_access_token
+from tests.conftest import SURVEY_CONFIG
+
+QUESTIONS = question_map(SURVEY_CONFIG)
+
+
+async def filtered(client, survey, admin_user, *filters):
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(
+        f"/api/v1/surveys/{survey.id}/responses", params={"answer": list(filters)}
+    )
+    assert response.status_code == 200, response.text
+    return sorted(item["id"] for item in response.json())
+
+
+def ids(*responses):
+    return sorted(response["id"] for response in responses)
+
+
+def test_filters_are_typed_like_stored_answers():
+    scale, option, checkbox, choice = parse_answer_filters(
+        QUESTIONS, ["Q1:4", "Q2:Member", "Q3:Evenings", "Q4:Yes"]
+    )
+
+    assert (scale.column, scale.value) == ("int_value", 4)
+    assert (option.column, option.value) == ("option_index", 1)
+    assert checkbox.documents == ({"Q3": "Evenings"}, {"Q3": ["Evenings"]})
+    assert choice.documents == ({"Q4": "Yes"}, {"Q4": {"choice": "Yes"}})
+
+
+@pytest.mark.parametrize(
+    ("answer", "error"),
+    [
+        ("Q1", "must look like"),
+        ("Q9:x", "Unknown question"),
+        ("Q1:many", "number from 1 to 5"),
+        ("Q2:Boss", "not an option"),
+    ],
+)
+def test_invalid_filters(answer, error):
+    with pytest.raises(ValueError, match=error):
+        parse_answer_filters(QUESTIONS, [answer])
+
+
+@pytest.mark.asyncio
+async def test_submitted_responses_match_on_typed_answers(client, survey, admin_user, submit):
+    early = await submit({"Q1": 4, "Q3": ["Mornings", "Evenings"], "Q4": {"choice": "Yes", "text": "x"}})
+    late = await submit({"Q1": 2, "Q3": ["Evenings"], "Q4": {"choice": "No", "text": ""}})
+
+    assert await filtered(client, survey, admin_user, "Q3:Evenings") == ids(early, late)
+    assert await filtered(client, survey, admin_user, "Q3:Mornings") == ids(early)
+    assert await filtered(client, survey, admin_user, "Q4:No", "Q1:2") == ids(late)
+    assert await filtered(client, survey, admin_user, "Q4:No", "Q1:4") == []
+
+
+@pytest.mark.asyncio
+async def test_drafts_match_either_stored_form(client, survey, admin_user, submit):
+    structured = await submit({"Q3": ["Evenings"], "Q4": {"choice": "Yes", "text": ""}}, is_draft=True)
+    bare = await submit({"Q3": "Evenings", "Q4": "Yes"}, is_draft=True)
+    await submit({"Q3": ["Mornings"], "Q4": "No"}, is_draft=True)
+
+    assert await filtered(client, survey, admin_user, "Q3:Evenings") == ids(structured, bare)
+    assert await filtered(client, survey, admin_user, "Q4:Yes") == ids(structured, bare)
+
+
+@pytest.mark.asyncio
+async def test_bad_filter_is_a_400(client, survey, admin_user):
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(f"/api/v1/surveys/{survey.id}/responses", params={"answer": "Q2:Boss"})
+
+    assert response.status_code == 400
+    assert "not an option" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_export_applies_answer_filters(client, survey, admin_user, submit):
+    await submit({"Q2": "Lead"})
+    member = await submit({"Q2": "Member"})
+
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(
+        f"/api/v1/surveys/{survey.id}/export", params={"format": "json", "answer": "Q2:Member"}
+    )
+
+    assert [item["id"] for item in response.json()] == [member["id"]]
@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.response_answer import ResponseAnswer
+from app.services.answers import typed_answer_rows
+from app.services.questions import question_map
+from tests.conftest import SURVEY_CONFIG
+
+QUESTIONS = question_map(SURVEY_CONFIG)
+
+
+def typed(answers):
+    rows = typed_answer_rows(QUESTIONS, uuid4(), uuid4(), answers)
+    return [
+        {key: row[key] for key in ("question_id", "item", "int_value", "text_value", "option_index", "choice_value") if key in row}
+        for row in rows
+    ]
+
+
+def test_options_are_stored_by_index():
+    assert typed({"Q2": "Member", "Q3": ["Mornings", "Evenings"]}) == [
+        {"question_id": "Q2", "item": 0, "option_index": 1},
+        {"question_id": "Q3", "item": 0, "option_index": 0},
+        {"question_id": "Q3", "item": 1, "option_index": 2},
+    ]
+
+
+def test_unknown_choice_and_free_text_use_separate_columns():
+    assert typed({"Q4": {"choice": "Maybe", "text": "alice"}, "Q5": "More pizza"}) == [
+        {"question_id": "Q4", "item": 0, "choice_value": "Maybe", "text_value": "alice"},
+        {"question_id": "Q5", "item": 0, "text_value": "More pizza"},
+    ]
+
+
+def test_scales_and_empty_answers():
+    assert typed({"Q1": 4, "Q2": "", "Q3": [], "Q9": "unknown question"}) == [
+        {"question_id": "Q1", "item": 0, "int_value": 4},
+    ]
+    assert typed({"Q1": "lots"}) == [{"question_id": "Q1", "item": 0, "choice_value": "lots"}]
+
+
+@pytest.mark.asyncio
+async def test_submit_writes_typed_rows(authenticated_client, db_session, survey):
+    response = await authenticated_client.post(
+        f"/api/v1/surveys/{survey.slug}/respond",
+        json={"answers": {"Q1": 5, "Q4": {"choice": "Yes", "text": "bob"}}, "is_draft": False},
+    )
+    assert response.status_code == 200
+
+    rows = (
+        await db_session.execute(
+            select(ResponseAnswer).order_by(ResponseAnswer.question_id, ResponseAnswer.item)
+        )
+    ).scalars().all()
+    assert [(row.question_id, row.int_value, row.option_index, row.text_value) for row in rows] == [
+        ("Q1", 5, None, None),
+        ("Q4", None, 0, "bob"),
+    ]
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.models.response import Response
+from app.models.survey import Survey
+from app.models.user import User
+from app.services.survey_config import store_config
+from tests.conftest import SURVEY_CONFIG
+
+
+async def make_survey(db_session, owner, slug, **fields) -> Survey:
+    survey = Survey(
+        slug=slug,
+        title=slug,
+        config_hash=await store_config(db_session, SURVEY_CONFIG),
+        created_by=owner.id,
+        **fields,
+    )
+    db_session.add(survey)
+    await db_session.commit()
+    return survey
+
+
+@pytest_asyncio.fixture
+async def other_admin(db_session) -> User:
+    user = User(id=uuid4(), github_id=2, github_username="otheradmin", is_admin=True)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+def outcomes(response) -> dict[str, str]:
+    return {item["id"]: item["status"] for item in response.json()["results"]}
+
+
+async def survey_column(db_session, column, survey_id):
+    return (await db_session.execute(select(column).where(Survey.id == survey_id))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_reports_each_id(admin_client, db_session, admin_user, other_admin):
+    mine = await make_survey(db_session, admin_user, "mine")
+    theirs = await make_survey(db_session, other_admin, "theirs")
+    missing = uuid4()
+
+    response = await admin_client.post(
+        "/api/v1/surveys/bulk/close", json={"ids": [str(mine.id), str(theirs.id), str(missing)]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["affected"] == 1
+    assert outcomes(response) == {
+        str(mine.id): "ok",
+        str(theirs.id): "forbidden",
+        str(missing): "not_found",
+    }
+    assert await survey_column(db_session, Survey.closes_at, mine.id) is not None
+    assert await survey_column(db_session, Survey.closes_at, theirs.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_results_follow_request_order_without_duplicates(
+    admin_client, db_session, admin_user
+):
+    first = await make_survey(db_session, admin_user, "first")
+    second = await make_survey(db_session, admin_user, "second")
+    ids = [str(second.id), str(first.id), str(second.id)]
+
+    response = await admin_client.post("/api/v1/surveys/bulk/close", json={"ids": ids})
+
+    assert response.json()["affected"] == 2
+    assert [item["id"] for item in response.json()["results"]] == [str(second.id), str(first.id)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_close_keeps_an_earlier_closing_time(admin_client, db_session, admin_user):
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    closed = await make_survey(db_session, admin_user, "closed", closes_at=yesterday)
+
+    response = await admin_client.post("/api/v1/surveys/bulk/close", json={"ids": [str(closed.id)]})
+
+    assert outcomes(response) == {str(closed.id): "ok"}
+    assert await survey_column(db_session, Survey.closes_at, closed.id) == yesterday
+
+
+@pytest.mark.asyncio
+async def test_bulk_reopen_clears_closing_time(admin_client, db_session, admin_user, other_admin):
+    mine = await make_survey(db_session, admin_user, "mine", closes_at=func.now())
+    theirs = await make_survey(db_session, other_admin, "theirs", closes_at=func.now())
+
+    response = await admin_client.post(
+        "/api/v1/surveys/bulk/reopen", json={"ids": [str(mine.id), str(theirs.id)]}
+    )
+
+    assert outcomes(response) == {str(mine.id): "ok", str(theirs.id): "forbidden"}
+    assert await survey_column(db_session, Survey.closes_at, mine.id) is None
+    assert await survey_column(db_session, Survey.closes_at, theirs.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_skips_deleted_and_foreign_surveys(
+    admin_client, db_session, admin_user, other_admin
+):
+    mine = await make_survey(db_session, admin_user, "mine")
+    gone = await make_survey(db_session, admin_user, "gone", deleted_at=func.now())
+    theirs = await make_survey(db_session, other_admin, "theirs")
+
+    response = await admin_client.post(
+        "/api/v1/surveys/bulk/delete", json={"ids": [str(mine.id), str(gone.id), str(theirs.id)]}
+    )
+
+    assert response.json()["affected"] == 1
+    assert outcomes(response) == {
+        str(mine.id): "ok",
+        str(gone.id): "not_found",
+        str(theirs.id): "forbidden",
+    }
+    assert await survey_column(db_session, Survey.deleted_at, mine.id) is not None
+    assert await survey_column(db_session, Survey.deleted_at, theirs.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_responses_only_touches_own_surveys(
+    admin_client, db_session, admin_user, other_admin, make_user, make_response
+):
+    mine = await make_survey(db_session, admin_user, "mine")
+    theirs = await make_survey(db_session, other_admin, "theirs")
+    user = await make_user()
+    kept_mine = await make_response(mine, await make_user(), {"Q1": 2})
+    deleted = await make_response(mine, user, {"Q1": 3})
+    foreign = await make_response(theirs, user, {"Q1": 4})
+    missing = uuid4()
+
+    response = await admin_client.post(
+        "/api/v1/surveys/bulk/delete-responses",
+        json={"ids": [str(deleted.id), str(foreign.id), str(missing)]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["affected"] == 1
+    assert outcomes(response) == {
+        str(deleted.id): "ok",
+        str(foreign.id): "forbidden",
+        str(missing): "not_found",
+    }
+    remaining = set((await db_session.execute(select(Response.id))).scalars().all())
+    assert remaining == {kept_mine.id, foreign.id}
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoints_require_an_admin(authenticated_client, survey):
+    response = await authenticated_client.post(
+        "/api/v1/surveys/bulk/delete", json={"ids": [str(survey.id)]}
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_an_empty_id_list(admin_client):
+    response = await admin_client.post("/api/v1/surveys/bulk/close", json={"ids": []})
+
+    assert response.status_code == 422
@@ -0,0 +1,69 @@
+import pytest
+
+from app.services import crosstab
+from app.utils.security import create_access_token
+
+
+async def get_crosstab(client, survey, admin_user, **params):
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(f"/api/v1/surveys/{survey.id}/crosstab", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def counts(table):
+    return {(cell["row"], cell["col"]): cell["count"] for cell in table["cells"]}
+
+
+@pytest.mark.asyncio
+async def test_multi_checkbox_answers_count_once_per_selection(client, survey, admin_user, submit):
+    await submit({"Q1": 4, "Q2": "Lead", "Q3": ["Mornings", "Evenings"]})
+    await submit({"Q1": 2, "Q2": "Member", "Q3": ["Mornings"]})
+    await submit({"Q1": 5, "Q2": "Lead", "Q3": ["Evenings"]})
+    # Drafts are not tabulated
+    await submit({"Q2": "Member", "Q3": ["Afternoons"]}, is_draft=True)
+
+    table = await get_crosstab(client, survey, admin_user, row="Q3", col="Q2", mean="Q1")
+
+    assert counts(table) == {
+        ("Mornings", "Lead"): 1,
+        ("Mornings", "Member"): 1,
+        ("Evenings", "Lead"): 2,
+    }
+    assert table["row_values"] == ["Mornings", "Evenings"]
+    assert table["col_values"] == ["Lead", "Member"]
+    assert table["responses"] == 3
+    means = {(cell["row"], cell["col"]): cell["mean"] for cell in table["cells"]}
+    assert means[("Evenings", "Lead")] == 4.5
+
+
+@pytest.mark.asyncio
+async def test_choice_with_text_and_scale_labels(client, survey, admin_user, submit):
+    await submit({"Q1": 3, "Q4": {"choice": "Yes", "text": "alice"}})
+    await submit({"Q1": 3, "Q4": {"choice": "No", "text": ""}})
+
+    table = await get_crosstab(client, survey, admin_user, row="Q1", col="Q4")
+
+    assert counts(table) == {("3", "Yes"): 1, ("3", "No"): 1}
+
+
+@pytest.mark.asyncio
+async def test_crosstab_is_cached_until_a_submission(client, survey, admin_user, submit, monkeypatch):
+    computed = []
+    statement = crosstab.crosstab_statement
+    monkeypatch.setattr(
+        crosstab, "crosstab_statement", lambda *args: computed.append(args) or statement(*args)
+    )
+    await submit({"Q2": "Lead", "Q3": ["Mornings"]})
+
+    first = await get_crosstab(client, survey, admin_user, row="Q3", col="Q2")
+    second = await get_crosstab(client, survey, admin_user, row="Q3", col="Q2")
+
+    assert second == first
+    assert len(computed) == 1
+
+    await submit({"Q2": "Member", "Q3": ["Mornings"]})
+    third = await get_crosstab(client, survey, admin_user, row="Q3", col="Q2")
+
+    assert len(computed) == 2
+    assert counts(third) == {("Mornings", "Lead"): 1, ("Mornings", "Member"): 1}
@@ -0,0 +1,227 @@
+import csv
+import io
+import json
+import zipfile
+import zlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+import zstandard
+from sqlalchemy import select, update
+
+from app.models.response import Response
+from app.models.survey import Survey
+from app.services.survey_config import store_config
+from tests.conftest import SURVEY_CONFIG
+
+
+async def raw_export(client, survey, **params) -> tuple[dict, bytes]:
+    """Fetch an export without letting the client undo its Content-Encoding."""
+    async with client.stream("GET", f"/api/v1/surveys/{survey.id}/export", params=params) as response:
+        assert response.status_code == 200, await response.aread()
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response.headers, body
+
+
+@pytest_asyncio.fixture
+async def answered_survey(survey, make_user, make_response):
+    alice = await make_user("alice")
+    bob = await make_user("bob")
+    await make_response(survey, alice, {"Q1": 4, "Q3": ["Mornings", "Evenings"]})
+    await make_response(survey, bob, {"Q2": "Lead"}, is_draft=True)
+    return survey
+
+
+def read_csv(body: bytes) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(body.decode())))
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_every_response(admin_client, answered_survey):
+    headers, body = await raw_export(admin_client, answered_survey, format="csv")
+
+    rows = read_csv(body)
+    assert rows[0] == ["id", "user_id", "github_username", "is_draft", "submitted_at", "created_at", "Q1", "Q2", "Q3"]
+    by_user = {row[2]: row for row in rows[1:]}
+    assert set(by_user) == {"alice", "bob"}
+    assert by_user["alice"][6:] == ["4", "", '["Mornings", "Evenings"]']
+    assert "Content-Encoding" not in headers
+
+
+@pytest.mark.asyncio
+async def test_json_export_is_a_valid_array(admin_client, answered_survey):
+    _, body = await raw_export(admin_client, answered_survey, format="json", status="submitted")
+
+    items = json.loads(body)
+    assert [item["github_username"] for item in items] == ["alice"]
+    assert items[0]["answers"] == {"Q1": 4, "Q3": ["Mornings", "Evenings"]}
+
+
+@pytest.mark.asyncio
+async def test_gzip_export(admin_client, answered_survey):
+    _, plain = await raw_export(admin_client, answered_survey, format="csv")
+    headers, body = await raw_export(admin_client, answered_survey, format="csv", compress="gzip")
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Disposition"].endswith(".csv.gz")
+    assert zlib.decompress(body, 31) == plain
+
+
+@pytest.mark.asyncio
+async def test_zstd_export(admin_client, answered_survey):
+    _, plain = await raw_export(admin_client, answered_survey, format="json")
+    headers, body = await raw_export(admin_client, answered_survey, format="json", compress="zstd")
+
+    assert headers["Content-Encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == plain
+
+
+@pytest.mark.asyncio
+async def test_empty_json_export(admin_client, survey):
+    _, body = await raw_export(admin_client, survey, format="json")
+
+    assert json.loads(body) == []
+
+
+@pytest_asyncio.fixture
+async def second_survey(db_session, admin_user, make_user, make_response):
+    survey = Survey(
+        slug="second-survey",
+        title="Second Survey",
+        config_hash=await store_config(db_session, SURVEY_CONFIG),
+        created_by=admin_user.id,
+    )
+    db_session.add(survey)
+    await db_session.commit()
+    await make_response(survey, await make_user("carol"), {"Q5": "Pairs, please", "Q1": 2})
+    return survey
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format", ["csv", "json"])
+async def test_archive_members_match_single_exports(
+    admin_client, answered_survey, second_survey, format
+):
+    response = await admin_client.get(
+        "/api/v1/surveys/export-archive",
+        params={"ids": [str(answered_survey.id), str(second_survey.id)], "format": format},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert archive.namelist() == [
+        f"test-survey-responses.{format}",
+        f"second-survey-responses.{format}",
+    ]
+    for survey in (answered_survey, second_survey):
+        _, single = await raw_export(admin_client, survey, format=format)
+        assert archive.read(f"{survey.slug}-responses.{format}") == single
+
+
+@pytest.mark.asyncio
+async def test_archive_lists_a_repeated_survey_once(admin_client, answered_survey):
+    response = await admin_client.get(
+        "/api/v1/surveys/export-archive",
+        params={"ids": [str(answered_survey.id)] * 2},
+    )
+
+    assert zipfile.ZipFile(io.BytesIO(response.content)).namelist() == ["test-survey-responses.csv"]
+
+
+@pytest.mark.asyncio
+async def test_archive_with_an_unknown_survey_is_not_found(admin_client, answered_survey):
+    response = await admin_client.get(
+        "/api/v1/surveys/export-archive",
+        params={"ids": [str(answered_survey.id), "00000000-0000-4000-8000-000000000000"]},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_projected_csv_has_only_the_requested_questions(admin_client, answered_survey):
+    _, body = await raw_export(admin_client, answered_survey, format="csv", questions=["Q3", "Q1"])
+
+    rows = read_csv(body)
+    assert rows[0][6:] == ["Q3", "Q1"]
+    by_user = {row[2]: row[6:] for row in rows[1:]}
+    assert by_user == {"alice": ['["Mornings", "Evenings"]', "4"], "bob": ["", ""]}
+
+
+@pytest.mark.asyncio
+async def test_projected_json_omits_other_and_missing_answers(admin_client, answered_survey):
+    _, body = await raw_export(admin_client, answered_survey, format="json", questions=["Q1", "Q2"])
+
+    answers = {item["github_username"]: item["answers"] for item in json.loads(body)}
+    assert answers == {"alice": {"Q1": 4}, "bob": {"Q2": "Lead"}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format", ["csv", "json"])
+async def test_anonymized_export_has_no_respondent_identity(
+    admin_client, db_session, answered_survey, format
+):
+    users = (await db_session.execute(select(Response.user_id))).scalars().all()
+
+    _, body = await raw_export(admin_client, answered_survey, format=format, anonymize="true")
+
+    for identity in [b"alice", b"bob", *(str(user_id).encode() for user_id in users)]:
+        assert identity not in body
+    if format == "json":
+        items = json.loads(body)
+        assert [item["github_username"] for item in items] == ["respondent_1", "respondent_2"]
+        assert all(item["user_id"] is None for item in items)
+    else:
+        rows = read_csv(body)[1:]
+        assert [(row[1], row[2]) for row in rows] == [("", "respondent_1"), ("", "respondent_2")]
+
+
+@pytest_asyncio.fixture
+async def dated_survey(db_session, survey, make_user, make_response):
+    """Three submissions a day apart, plus a draft; returns their submitted_at by username."""
+    start = datetime(2026, 5, 1, 12, tzinfo=timezone.utc)
+    dates = {}
+    for day, name in enumerate(["early", "middle", "late"]):
+        response = await make_response(survey, await make_user(name), {"Q1": day + 1})
+        dates[name] = start + timedelta(days=day)
+        await db_session.execute(
+            update(Response).where(Response.id == response.id).values(submitted_at=dates[name])
+        )
+    await make_response(survey, await make_user("drafter"), {"Q1": 5}, is_draft=True)
+    await db_session.commit()
+    return dates
+
+
+async def exported_usernames(client, survey, **params) -> list[str]:
+    _, body = await raw_export(client, survey, format="json", **params)
+    return [item["github_username"] for item in json.loads(body)]
+
+
+@pytest.mark.asyncio
+async def test_date_range_bounds_are_inclusive(admin_client, survey, dated_survey):
+    usernames = await exported_usernames(
+        admin_client,
+        survey,
+        from_date=dated_survey["middle"].isoformat(),
+        to_date=dated_survey["late"].isoformat(),
+    )
+
+    assert usernames == ["middle", "late"]
+
+
+@pytest.mark.asyncio
+async def test_date_range_excludes_just_outside_either_edge(admin_client, survey, dated_survey):
+    tick = timedelta(microseconds=1)
+
+    after_early = await exported_usernames(
+        admin_client, survey, from_date=(dated_survey["early"] + tick).isoformat()
+    )
+    before_late = await exported_usernames(
+        admin_client, survey, to_date=(dated_survey["late"] - tick).isoformat()
+    )
+
+    assert after_early == ["middle", "late"]
+    assert before_late == ["early", "middle"]
@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import suppress
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import ClientDisconnect
+
+from app.database import get_bulk_db, get_db
+from app.main import app
+from app.routers import surveys
+from app.services.export_executor import ExportExecutor, ExportQueueFull, ExportStreamingResponse
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+def executor(monkeypatch) -> ExportExecutor:
+    """One encoding slot and one queue place: two exports admitted at a time."""
+    executor = ExportExecutor(workers=1, queue_size=1)
+    monkeypatch.setattr(surveys, "export_executor", executor)
+    return executor
+
+
+@pytest.fixture
+def gate(monkeypatch) -> asyncio.Event:
+    """Hold every CSV export open until the event is set."""
+    gate = asyncio.Event()
+
+    async def gated_csv(sessions, survey_id, filters) -> AsyncIterator[bytes]:
+        await gate.wait()
+        yield b"id\n"
+
+    monkeypatch.setattr(surveys, "stream_csv", gated_csv)
+    return gate
+
+
+@pytest.mark.asyncio
+async def test_concurrent_exports_beyond_capacity_are_refused(
+    admin_client, survey, executor, gate
+):
+    # Concurrent requests cannot share the test session; give each its own
+    engine = create_async_engine(TEST_DATABASE_URL)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def own_session() -> AsyncIterator[AsyncSession]:
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = app.dependency_overrides[get_bulk_db] = own_session
+    capacity = executor.workers + executor.queue_size
+    try:
+        requests = [
+            asyncio.create_task(
+                admin_client.get(f"/api/v1/surveys/{survey.id}/export", params={"format": "csv"})
+            )
+            for _ in range(capacity + 1)
+        ]
+        done, _ = await asyncio.wait(requests, timeout=5, return_when=asyncio.FIRST_COMPLETED)
+        refused = [task.result() for task in done]
+        gate.set()
+        responses = await asyncio.gather(*requests)
+    finally:
+        await engine.dispose()
+
+    assert [response.status_code for response in refused] == [503]
+    assert refused[0].headers["Retry-After"]
+    assert sorted(response.status_code for response in responses) == [200] * capacity + [503]
+    assert executor._pending == 0
+
+
+def test_reservations_count_before_the_export_starts():
+    executor = ExportExecutor(workers=1, queue_size=1)
+    first = executor.reserve()
+    executor.reserve()
+
+    with pytest.raises(ExportQueueFull):
+        executor.reserve()
+
+    first.release()
+    first.release()
+    executor.reserve()
+    with pytest.raises(ExportQueueFull):
+        executor.reserve()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spec_version", ["2.0", "2.4"])
+async def test_disconnect_mid_stream_releases_the_slot_and_reservation(spec_version):
+    executor = ExportExecutor(workers=1, queue_size=0)
+    reservation = executor.reserve()
+    streaming = asyncio.Event()
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"first"
+        await asyncio.Event().wait()
+
+    async def receive() -> dict:
+        await streaming.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body":
+            streaming.set()
+            # With ASGI 2.4 a disconnect shows up as a failing send
+            if spec_version == "2.4":
+                raise OSError("client went away")
+
+    response = ExportStreamingResponse(executor.stream(body(), reservation), reservation)
+    scope = {"type": "http", "asgi": {"version": "3.0", "spec_version": spec_version}}
+    with suppress(ClientDisconnect):
+        await asyncio.wait_for(response(scope, receive, send), 5)
+
+    assert executor._pending == 0
+    assert not executor._slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_response_never_started_releases_the_reservation():
+    executor = ExportExecutor(workers=1, queue_size=0)
+    reservation = executor.reserve()
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b""
+
+    async def receive() -> dict:
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        raise OSError("client went away")
+
+    response = ExportStreamingResponse(executor.stream(body(), reservation), reservation)
+    with pytest.raises(ClientDisconnect):
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+    assert executor._pending == 0
@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_liveness_is_public(client):
+    response = await client.get("/api/v1/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_requires_sign_in(client):
+    assert (await client.get("/api/v1/health/loop")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_is_admin_only(authenticated_client):
+    assert (await authenticated_client.get("/api/v1/health/loop")).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_for_admins(admin_client):
+    response = await admin_client.get("/api/v1/health/loop")
+
+    assert response.status_code == 200
+    assert {"lag_ms", "samples", "stalls"} <= response.json().keys()
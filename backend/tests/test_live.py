@@ -0,0 +1,149 @@
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.main import app
+from app.services.live import RESPONSE_CHANNEL, response_feed
+from app.services.notifications import pg_listener
+from app.utils.security import create_access_token
+
+# Seconds to wait for an event before failing the test
+EVENT_TIMEOUT = 5.0
+
+
+@pytest_asyncio.fixture
+async def listener() -> AsyncIterator[None]:
+    """Start and end each test without a listener connection (it is bound to the test's loop)."""
+    await pg_listener.close()
+    yield
+    await pg_listener.close()
+
+
+@asynccontextmanager
+async def sse_stream(path: str, token: str) -> AsyncIterator[asyncio.Queue]:
+    """
+    Run one GET through the ASGI app, queueing the status and then each body
+    chunk as it is sent. httpx's ASGI transport buffers whole responses, so
+    it cannot read an endless stream. Leaving the block disconnects.
+    """
+    chunks: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test"), (b"cookie", f"surveyflow_token={token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+
+    async def receive() -> dict:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            await chunks.put(message["status"])
+        elif message.get("body"):
+            await chunks.put(message["body"])
+
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        yield chunks
+    finally:
+        disconnected.set()
+        try:
+            await asyncio.wait_for(task, EVENT_TIMEOUT)
+        except asyncio.TimeoutError:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+async def next_event(chunks: asyncio.Queue) -> tuple[str, dict]:
+    chunk = (await asyncio.wait_for(chunks.get(), EVENT_TIMEOUT)).decode()
+    event, data = chunk.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+@pytest.mark.asyncio
+async def test_submit_is_pushed_to_the_live_feed(client, listener, admin_user, survey, submit):
+    path = f"/api/v1/surveys/{survey.id}/responses/stream"
+
+    async with sse_stream(path, create_access_token(admin_user.id)) as chunks:
+        assert await asyncio.wait_for(chunks.get(), EVENT_TIMEOUT) == 200
+        assert await next_event(chunks) == ("counts", {"total": 0, "submitted": 0})
+
+        submitted = await submit({"Q1": 4})
+
+        event, data = await next_event(chunks)
+        assert event == "response"
+        assert data["id"] == submitted["id"]
+        assert data["created"] is True
+        assert data["is_draft"] is False
+        assert await next_event(chunks) == ("counts", {"total": 1, "submitted": 1})
+
+    # Disconnecting unsubscribes the stream
+    assert str(survey.id) not in response_feed._subscribers
+
+
+@pytest.mark.asyncio
+async def test_draft_then_submit_counts_one_response(client, listener, admin_user, survey, submit):
+    path = f"/api/v1/surveys/{survey.id}/responses/stream"
+
+    async with sse_stream(path, create_access_token(admin_user.id)) as chunks:
+        await chunks.get()
+        await next_event(chunks)
+
+        await submit({"Q1": 2}, is_draft=True)
+
+        assert (await next_event(chunks))[1]["is_draft"] is True
+        assert await next_event(chunks) == ("counts", {"total": 1, "submitted": 0})
+
+
+@pytest.mark.asyncio
+async def test_feed_ends_when_the_listener_is_lost_and_resubscribes(
+    db_session, listener, survey, caplog
+):
+    async with response_feed.subscribe(survey.id) as queue:
+        pid = pg_listener._connection.get_server_pid()
+        await db_session.execute(select(func.pg_terminate_backend(pid)))
+        await db_session.commit()
+
+        assert await asyncio.wait_for(queue.get(), EVENT_TIMEOUT) is None
+        assert not pg_listener.listening
+    assert "Notification listener connection lost" in caplog.text
+
+    # A new subscriber reconnects the listener and receives notifications again
+    async with response_feed.subscribe(survey.id) as queue:
+        assert pg_listener.listening
+        payload = json.dumps({"survey_id": str(survey.id), "id": "x"})
+        await db_session.execute(select(func.pg_notify(RESPONSE_CHANNEL, payload)))
+        await db_session.commit()
+
+        assert await asyncio.wait_for(queue.get(), EVENT_TIMEOUT) == json.loads(payload)
+
+
+@pytest.mark.asyncio
+async def test_close_ends_streams_without_reporting_a_lost_connection(listener, survey, caplog):
+    caplog.set_level(logging.WARNING, logger="app.services.notifications")
+
+    async with response_feed.subscribe(survey.id) as queue:
+        await pg_listener.close()
+
+        assert not pg_listener.listening
+        assert await asyncio.wait_for(queue.get(), EVENT_TIMEOUT) is None
+
+    assert "connection lost" not in caplog.text
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+
+from app.database import bulk_engine
+from app.models.response import Response
+from app.models.survey import Survey
+from app.services.purge import PURGE_LOCK_KEY, purge_deleted_surveys
+from app.services.survey_config import store_config
+from tests.conftest import SURVEY_CONFIG
+
+RETENTION = timedelta(days=30)
+
+
+@pytest_asyncio.fixture
+async def purge_engine():
+    """Count response DELETEs on the purger's engine, which is not overridden in tests."""
+    # The module engine's pool may hold connections from another test's loop
+    await bulk_engine.dispose()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE FROM responses"):
+            statements.append(statement)
+
+    event.listen(bulk_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bulk_engine.sync_engine, "before_cursor_execute", record)
+        await bulk_engine.dispose()
+
+
+async def make_survey(db_session, admin_user, slug, deleted_days_ago=None) -> Survey:
+    deleted_at = None
+    if deleted_days_ago is not None:
+        deleted_at = datetime.now(timezone.utc) - timedelta(days=deleted_days_ago)
+    survey = Survey(
+        slug=slug,
+        title=slug,
+        config_hash=await store_config(db_session, SURVEY_CONFIG),
+        created_by=admin_user.id,
+        deleted_at=deleted_at,
+    )
+    db_session.add(survey)
+    await db_session.commit()
+    return survey
+
+
+async def seed_responses(survey, make_user, make_response, submitted, drafts) -> set:
+    ids = set()
+    for n in range(submitted + drafts):
+        response = await make_response(survey, await make_user(), {"Q1": 3}, is_draft=n >= submitted)
+        ids.add(response.id)
+    return ids
+
+
+async def remaining(db_session, column):
+    return set((await db_session.execute(select(column))).scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_expired_surveys_in_batches(
+    db_session, admin_user, make_user, make_response, purge_engine
+):
+    expired = await make_survey(db_session, admin_user, "expired", deleted_days_ago=45)
+    await seed_responses(expired, make_user, make_response, submitted=3, drafts=2)
+    live = await make_survey(db_session, admin_user, "live")
+    live_ids = await seed_responses(live, make_user, make_response, submitted=2, drafts=2)
+
+    purged = await purge_deleted_surveys(RETENTION, batch_size=2)
+
+    assert purged == 1
+    # 5 responses at 2 per batch: two full batches and a short final one
+    assert len(purge_engine) == 3
+    assert await remaining(db_session, Response.id) == live_ids
+    assert await remaining(db_session, Survey.id) == {live.id}
+
+
+@pytest.mark.asyncio
+async def test_purge_keeps_surveys_inside_the_retention_period(
+    db_session, admin_user, make_user, make_response, purge_engine
+):
+    expired = await make_survey(db_session, admin_user, "expired", deleted_days_ago=31)
+    await seed_responses(expired, make_user, make_response, submitted=1, drafts=1)
+    recent = await make_survey(db_session, admin_user, "recent", deleted_days_ago=29)
+    recent_ids = await seed_responses(recent, make_user, make_response, submitted=1, drafts=1)
+
+    purged = await purge_deleted_surveys(RETENTION, batch_size=10)
+
+    assert purged == 1
+    assert await remaining(db_session, Survey.id) == {recent.id}
+    assert await remaining(db_session, Response.id) == recent_ids
+
+
+@pytest.mark.asyncio
+async def test_purge_without_expired_surveys_deletes_nothing(
+    db_session, admin_user, make_user, make_response, purge_engine
+):
+    live = await make_survey(db_session, admin_user, "live")
+    live_ids = await seed_responses(live, make_user, make_response, submitted=2, drafts=2)
+
+    assert await purge_deleted_surveys(RETENTION, batch_size=2) == 0
+    assert purge_engine == []
+    assert await remaining(db_session, Response.id) == live_ids
+
+
+@pytest.mark.asyncio
+async def test_purge_skips_when_another_worker_holds_the_lock(
+    db_session, admin_user, make_user, make_response, purge_engine
+):
+    expired = await make_survey(db_session, admin_user, "expired", deleted_days_ago=45)
+    expired_ids = await seed_responses(expired, make_user, make_response, submitted=1, drafts=1)
+
+    await db_session.execute(select(func.pg_advisory_lock(PURGE_LOCK_KEY)))
+    try:
+        assert await purge_deleted_surveys(RETENTION, batch_size=2) == 0
+    finally:
+        await db_session.execute(select(func.pg_advisory_unlock(PURGE_LOCK_KEY)))
+        await db_session.commit()
+
+    assert await remaining(db_session, Response.id) == expired_ids
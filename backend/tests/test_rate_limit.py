@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.rate_limit import RateLimitBucket
+from app.routers import responses
+from app.services.rate_limit import (
+    InMemoryTokenBucketLimiter,
+    PostgresTokenBucketLimiter,
+    prune_idle_buckets_statement,
+)
+
+
+@pytest.fixture(params=[InMemoryTokenBucketLimiter, PostgresTokenBucketLimiter])
+def limiter(request, monkeypatch):
+    # Two saves, then one token every 100 seconds
+    limiter = request.param(capacity=2, refill_per_second=0.01)
+    monkeypatch.setattr(responses, "respond_rate_limiter", limiter)
+    return limiter
+
+
+async def respond(client, survey, is_draft=True):
+    return await client.post(
+        f"/api/v1/surveys/{survey.slug}/respond",
+        json={"answers": {"Q1": 3}, "is_draft": is_draft},
+    )
+
+
+@pytest.mark.asyncio
+async def test_draft_saves_beyond_capacity_get_429(authenticated_client, survey, limiter):
+    assert (await respond(authenticated_client, survey)).status_code == 200
+    assert (await respond(authenticated_client, survey)).status_code == 200
+
+    limited = await respond(authenticated_client, survey)
+
+    assert limited.status_code == 429
+    assert 0 < int(limited.headers["Retry-After"]) <= 100
+
+
+@pytest.mark.asyncio
+async def test_final_submit_bypasses_the_limit(authenticated_client, survey, limiter):
+    for _ in range(3):
+        await respond(authenticated_client, survey)
+
+    submitted = await respond(authenticated_client, survey, is_draft=False)
+
+    assert submitted.status_code == 200
+    assert submitted.json()["is_draft"] is False
+
+
+@pytest.mark.asyncio
+async def test_unknown_slug_is_not_limited(authenticated_client, db_session, limiter):
+    response = await authenticated_client.post(
+        "/api/v1/surveys/no-such-survey/respond", json={"answers": {}, "is_draft": True}
+    )
+
+    assert response.status_code == 404
+    # Unknown slugs add no buckets
+    assert (await db_session.execute(select(func.count()).select_from(RateLimitBucket))).scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_postgres_bucket_update_commits_on_its_own(db_session):
+    limiter = PostgresTokenBucketLimiter(capacity=2, refill_per_second=0.01)
+
+    assert await limiter.acquire(db_session, "respond:user:survey") == 0
+    # The bucket row is not left locked for the rest of the request
+    assert not db_session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_prune_deletes_only_idle_buckets(db_session):
+    db_session.add_all(
+        [
+            RateLimitBucket(key="idle", tokens=0, updated_at=func.now() - timedelta(hours=1)),
+            RateLimitBucket(key="active", tokens=0, updated_at=func.now()),
+        ]
+    )
+    await db_session.commit()
+
+    await db_session.execute(prune_idle_buckets_statement(timedelta(minutes=10)))
+    await db_session.commit()
+
+    keys = (await db_session.execute(select(RateLimitBucket.key))).scalars().all()
+    assert keys == ["active"]
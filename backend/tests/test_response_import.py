@@ -0,0 +1,238 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.schema import CreateTable
+
+from app.models.response import Response
+from app.models.response_answer import ResponseAnswer
+from app.models.user import User
+from app.services.questions import question_map
+from app.services.response_import import (
+    csv_records,
+    import_rows,
+    merge_statement,
+    ndjson_records,
+    parse_cell,
+    validate_answer,
+)
+from app.utils.hashing import content_hash
+from app.utils.security import create_access_token
+from tests.conftest import SURVEY_CONFIG
+
+QUESTIONS = question_map(SURVEY_CONFIG)
+
+
+async def chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+async def upload(client, survey, admin_user, body: str, format: str = "csv") -> dict:
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.post(
+        f"/api/v1/surveys/{survey.id}/responses/import",
+        params={"format": format},
+        content=body.encode(),
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def stored_answers(db_session, survey) -> dict[str, dict]:
+    rows = await db_session.execute(
+        select(User.github_username, Response.answers)
+        .join(User, Response.user_id == User.id)
+        .where(Response.survey_id == survey.id, Response.is_draft.is_(False))
+    )
+    return dict(rows.all())
+
+
+def errors(report) -> list[tuple[int, str]]:
+    return [(error["row"], error["error"]) for error in report["errors"]]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_span_chunks_and_quoted_newlines():
+    data = 'github_username,Q5\r\nalice,"two\nlines"\n\nbob,plain\n'.encode("utf-8-sig")
+
+    records = await collect(csv_records(chunked(data)))
+
+    assert records == [
+        (2, {"github_username": "alice", "Q5": "two\nlines"}),
+        (4, {"github_username": "bob", "Q5": "plain"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_upload_ending_inside_quotes_is_rejected():
+    with pytest.raises(ValueError, match="inside a quoted field"):
+        await collect(csv_records(chunked(b'github_username,Q5\nalice,"open\n')))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records_keep_line_numbers():
+    data = b'{"github_username": "alice"}\n\nnot json\n[1]'
+
+    records = await collect(ndjson_records(chunked(data)))
+
+    assert records == [(1, {"github_username": "alice"}), (3, None), (4, [1])]
+
+
+def test_parse_cell_reads_the_export_format():
+    assert parse_cell(QUESTIONS["Q1"], " 4 ") == 4
+    assert parse_cell(QUESTIONS["Q3"], '["Mornings", "Evenings"]') == ["Mornings", "Evenings"]
+    assert parse_cell(QUESTIONS["Q3"], "Mornings; Evenings") == ["Mornings", "Evenings"]
+    assert parse_cell(QUESTIONS["Q4"], '{"choice": "Yes", "text": "bob"}') == {"choice": "Yes", "text": "bob"}
+    assert parse_cell(QUESTIONS["Q2"], "") is None
+    with pytest.raises(ValueError, match="number from 1 to 5"):
+        parse_cell(QUESTIONS["Q1"], "four")
+
+
+def test_choice_with_text_is_normalized():
+    assert validate_answer(QUESTIONS["Q4"], "Yes") == {"choice": "Yes", "text": ""}
+    assert validate_answer(QUESTIONS["Q4"], {"choice": "No"}) == {"choice": "No", "text": ""}
+    with pytest.raises(ValueError, match="not an option"):
+        validate_answer(QUESTIONS["Q4"], "Maybe")
+    with pytest.raises(ValueError, match="choice and an optional text"):
+        validate_answer(QUESTIONS["Q4"], {"choice": "Yes", "note": "x"})
+
+
+@pytest.mark.asyncio
+async def test_csv_import_merges_valid_rows_and_reports_the_rest(
+    client, db_session, survey, admin_user, make_user, make_response
+):
+    await make_user("alice")
+    await make_response(survey, await make_user("bob"), {"Q1": 1}, is_draft=True)
+    await make_response(survey, await make_user("carol"), {"Q1": 5})
+
+    report = await upload(
+        client,
+        survey,
+        admin_user,
+        "github_username,submitted_at,Q1,Q3,Q4\n"
+        "alice,2026-01-02T03:04:05,4,Mornings;Evenings,Yes\n"
+        "bob,,2,,\n"
+        "carol,,3,,\n"
+        "zed,,3,,\n"
+        "alice,,1,,\n"
+        "dave,,9,,\n",
+    )
+
+    assert report["received"] == 6
+    assert report["imported"] == 2
+    assert errors(report) == [
+        (4, "Respondent has already submitted a response"),
+        (5, "Unknown GitHub user"),
+        (6, "Respondent appears earlier in the upload"),
+        (7, "Q1 takes a number from 1 to 5"),
+    ]
+    assert report["error_count"] == 4
+
+    assert await stored_answers(db_session, survey) == {
+        "alice": {"Q1": 4, "Q3": ["Mornings", "Evenings"], "Q4": {"choice": "Yes", "text": ""}},
+        # The draft was finalized with the imported answers
+        "bob": {"Q1": 2},
+        # The existing submission was kept
+        "carol": {"Q1": 5},
+    }
+    typed = (await db_session.execute(select(ResponseAnswer.question_id))).scalars().all()
+    assert sorted(typed) == ["Q1", "Q1", "Q3", "Q3", "Q4"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import(client, db_session, survey, admin_user, make_user):
+    await make_user("alice")
+    await make_user("bob")
+    lines = [
+        {"github_username": "alice", "answers": {"Q2": "Lead", "Q4": "No"}},
+        "not an object",
+        {"github_username": "bob", "answers": {"Q2": "Lead"}, "is_draft": True},
+        {"github_username": "bob", "answers": {"Q9": "x"}},
+        {"github_username": "bob", "answers": {"Q5": "See you"}, "submitted_at": "2026-05-01T10:00:00+02:00"},
+    ]
+
+    report = await upload(
+        client, survey, admin_user, "\n".join(json.dumps(line) for line in lines), format="ndjson"
+    )
+
+    assert report["imported"] == 2
+    assert errors(report) == [
+        (2, "Line is not a JSON object"),
+        (3, "Drafts are not imported"),
+        (4, "Unknown question: Q9"),
+    ]
+    assert await stored_answers(db_session, survey) == {
+        "alice": {"Q2": "Lead", "Q4": {"choice": "No", "text": ""}},
+        "bob": {"Q5": "See you"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_usernames_resolve_exactly_before_ignoring_case(
+    client, db_session, survey, admin_user, make_user
+):
+    await make_user("Dana")
+    await make_user("dana")
+    await make_user("Erin")
+
+    report = await upload(
+        client, survey, admin_user, "github_username,Q1\ndana,1\nDANA,2\nerin,3\n"
+    )
+
+    assert report["imported"] == 2
+    assert errors(report) == [(3, "GitHub username matches several users when case is ignored")]
+    assert await stored_answers(db_session, survey) == {"dana": {"Q1": 1}, "Erin": {"Q1": 3}}
+
+
+@pytest.mark.asyncio
+async def test_unreadable_upload_is_a_400(client, survey, admin_user):
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.post(
+        f"/api/v1/surveys/{survey.id}/responses/import", content=b"github_username,Q9\nalice,x\n"
+    )
+
+    assert response.status_code == 400
+    assert "Unknown question columns: Q9" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_merge_skips_respondents_who_submitted_meanwhile(db_session, survey, make_user, make_response):
+    alice = await make_user("alice")
+    bob = await make_user("bob")
+    await db_session.execute(CreateTable(import_rows))
+    await db_session.execute(
+        insert(import_rows),
+        [
+            {
+                "upload_row": row,
+                "id": uuid4(),
+                "github_username": user.github_username,
+                "user_id": user.id,
+                "answers": {"Q1": row},
+                "answers_hash": content_hash({"Q1": row}),
+                "search_text": "",
+                "submitted_at": datetime.now(timezone.utc),
+            }
+            for row, user in ((2, alice), (3, bob))
+        ],
+    )
+    # Submitted after the import's checks, before its merge
+    submitted = Response(survey_id=survey.id, user_id=bob.id, answers={"Q1": 5}, answers_hash="", is_draft=False)
+    db_session.add(submitted)
+    await db_session.flush()
+
+    merged = (await db_session.execute(merge_statement(survey.id))).all()
+
+    assert [response.answers for response in merged] == [{"Q1": 2}]
+    skipped = await db_session.execute(
+        select(import_rows.c.github_username).where(import_rows.c.response_id.is_(None))
+    )
+    assert skipped.scalars().all() == ["bob"]
+    await db_session.rollback()
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import Text, cast, literal_column, select
+
+from app.models.response import Response
+
+
+async def respond(client, survey, answers, is_draft=True, revision=None):
+    return await client.post(
+        f"/api/v1/surveys/{survey.slug}/respond",
+        json={"answers": answers, "is_draft": is_draft, "revision": revision},
+    )
+
+
+async def row_version(db_session, response_id) -> tuple:
+    """The row's revision and xmin; xmin changes whenever the row is rewritten."""
+    return (
+        await db_session.execute(
+            select(Response.revision, cast(literal_column("responses.xmin"), Text)).where(
+                Response.id == response_id
+            )
+        )
+    ).one()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_draft_is_not_rewritten(authenticated_client, db_session, survey):
+    first = (await respond(authenticated_client, survey, {"Q1": 3})).json()
+    before = await row_version(db_session, first["id"])
+
+    again = await respond(authenticated_client, survey, {"Q1": 3}, revision=first["revision"])
+
+    assert again.status_code == 200
+    assert again.json()["revision"] == first["revision"] == 1
+    assert again.json()["updated_at"] == first["updated_at"]
+    assert await row_version(db_session, first["id"]) == before
+
+
+@pytest.mark.asyncio
+async def test_changed_draft_bumps_the_revision(authenticated_client, survey):
+    await respond(authenticated_client, survey, {"Q1": 3})
+
+    changed = await respond(authenticated_client, survey, {"Q1": 4}, revision=1)
+
+    assert changed.status_code == 200
+    assert changed.json()["revision"] == 2
+    assert changed.json()["answers"] == {"Q1": 4}
+
+
+@pytest.mark.asyncio
+async def test_stale_revision_conflicts(authenticated_client, survey):
+    await respond(authenticated_client, survey, {"Q1": 3})
+    await respond(authenticated_client, survey, {"Q1": 4}, revision=1)
+
+    stale = await respond(authenticated_client, survey, {"Q1": 5}, revision=1)
+
+    assert stale.status_code == 409
+    mine = await authenticated_client.get(f"/api/v1/surveys/{survey.slug}/my-response")
+    assert mine.json()["answers"] == {"Q1": 4}
+
+
+@pytest.mark.asyncio
+async def test_submitted_response_cannot_be_changed(authenticated_client, survey):
+    await respond(authenticated_client, survey, {"Q1": 3}, is_draft=False)
+
+    for is_draft in (True, False):
+        response = await respond(authenticated_client, survey, {"Q1": 4}, is_draft=is_draft)
+        assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_final_submit_with_identical_answers_is_written(authenticated_client, db_session, survey):
+    draft = (await respond(authenticated_client, survey, {"Q1": 3})).json()
+
+    submitted = await respond(authenticated_client, survey, {"Q1": 3}, is_draft=False, revision=1)
+
+    assert submitted.status_code == 200
+    body = submitted.json()
+    assert body["is_draft"] is False
+    assert body["submitted_at"] is not None
+    assert body["revision"] == draft["revision"] + 1
+    stored = (await db_session.execute(select(Response.is_draft))).scalar_one()
+    assert stored is False
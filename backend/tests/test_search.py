@@ -0,0 +1,60 @@
+import pytest
+
+from app.utils.security import create_access_token
+
+
+async def search(client, survey, admin_user, **params) -> list[dict]:
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(f"/api/v1/surveys/{survey.id}/responses", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matches_and_highlights(client, survey, admin_user, submit):
+    strong = await submit({"Q5": "Python, python and more Python every day"})
+    weak = await submit({"Q5": "I mostly write Rust, some python"}, is_draft=True)
+    await submit({"Q5": "Nothing relevant here"})
+    choice = await submit({"Q4": {"choice": "Yes", "text": "my python friend"}})
+
+    results = await search(client, survey, admin_user, q="python")
+
+    assert [item["id"] for item in results][0] == strong["id"]
+    assert {item["id"] for item in results} == {strong["id"], weak["id"], choice["id"]}
+    assert all(item["rank"] > 0 for item in results)
+    assert "<b>python</b>" in results[-1]["snippet"].lower()
+
+
+@pytest.mark.asyncio
+async def test_search_is_paged(client, survey, admin_user, submit):
+    for count in range(1, 6):
+        await submit({"Q5": " ".join(["pizza"] * count) + " for lunch"})
+
+    everything = await search(client, survey, admin_user, q="pizza", limit=200)
+    first = await search(client, survey, admin_user, q="pizza", limit=2)
+    second = await search(client, survey, admin_user, q="pizza", limit=2, offset=2)
+    last = await search(client, survey, admin_user, q="pizza", limit=2, offset=4)
+
+    assert len(everything) == 5
+    assert first + second + last == everything
+    assert [item["rank"] for item in everything] == sorted((item["rank"] for item in everything), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_search_combines_with_answer_filters(client, survey, admin_user, submit):
+    lead = await submit({"Q2": "Lead", "Q5": "coffee first"})
+    await submit({"Q2": "Member", "Q5": "coffee always"})
+
+    results = await search(client, survey, admin_user, q="coffee", answer="Q2:Lead")
+
+    assert [item["id"] for item in results] == [lead["id"]]
+
+
+@pytest.mark.asyncio
+async def test_search_page_size_is_capped(client, survey, admin_user):
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+    response = await client.get(
+        f"/api/v1/surveys/{survey.id}/responses", params={"q": "x", "limit": 1000}
+    )
+
+    assert response.status_code == 422
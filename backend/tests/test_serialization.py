@@ -0,0 +1,53 @@
+import pytest
+
+from app.config import settings
+from app.utils.security import create_access_token
+
+
+async def both_paths(client, monkeypatch, url, **params) -> tuple[bytes, bytes]:
+    """The body of a GET with FAST_JSON_RESPONSES off, then on."""
+    bodies = []
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        bodies.append(response.content)
+    return bodies[0], bodies[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [{}, {"answer": "Q2:Lead"}, {"q": "pizza"}])
+async def test_admin_lists_are_identical(client, survey, admin_user, submit, monkeypatch, params):
+    await submit({"Q1": 4, "Q2": "Lead", "Q5": "More pizza"})
+    await submit({"Q2": "Member", "Q4": {"choice": "Yes", "text": "pizza pal"}}, is_draft=True)
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+
+    standard, fast = await both_paths(client, monkeypatch, f"/api/v1/surveys/{survey.id}/responses", **params)
+
+    assert fast == standard
+    assert standard != b"[]"
+
+
+@pytest.mark.asyncio
+async def test_survey_list_is_identical(client, survey, admin_user, submit, monkeypatch):
+    await submit({"Q1": 4})
+    client.cookies.set("surveyflow_token", create_access_token(admin_user.id))
+
+    standard, fast = await both_paths(client, monkeypatch, "/api/v1/surveys/")
+
+    assert fast == standard
+
+
+@pytest.mark.asyncio
+async def test_respondent_lists_are_identical(authenticated_client, survey, monkeypatch):
+    await authenticated_client.post(
+        f"/api/v1/surveys/{survey.slug}/respond", json={"answers": {"Q1": 2}, "is_draft": True}
+    )
+
+    for url, params in (
+        ("/api/v1/surveys/active", {}),
+        ("/api/v1/me/responses", {}),
+        ("/api/v1/me/responses", {"include_answers": "true"}),
+    ):
+        standard, fast = await both_paths(authenticated_client, monkeypatch, url, **params)
+        assert fast == standard, url
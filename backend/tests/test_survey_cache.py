@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, update
+
+from app.models.survey import Survey
+from app.services.notifications import pg_listener
+from app.services.survey_cache import slug_changed_statement, survey_cache
+from tests.conftest import SURVEY_CONFIG
+
+# Seconds to wait for a notification to reach the cache
+NOTIFY_TIMEOUT = 5.0
+
+
+@pytest_asyncio.fixture
+async def cache() -> AsyncIterator[None]:
+    """Turn on the worker's survey cache, which the test settings disable."""
+    await pg_listener.close()
+    survey_cache.max_entries = 16
+    survey_cache.clear()
+    survey_cache._last_reconnect = 0.0
+    yield
+    survey_cache.max_entries = 0
+    survey_cache.clear()
+    await pg_listener.close()
+
+
+async def public(client, slug):
+    return await client.get(f"/api/v1/surveys/{slug}/public")
+
+
+async def wait_until_evicted(slug: str) -> None:
+    async def evicted() -> None:
+        while slug in survey_cache._surveys:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(evicted(), NOTIFY_TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_served_from_the_cache(admin_client, db_session, cache, survey):
+    assert (await public(admin_client, survey.slug)).json()["title"] == "Test Survey"
+    assert survey.slug in survey_cache._surveys
+
+    # Changed behind the cache's back and not announced: the cached copy is served
+    await db_session.execute(update(Survey).where(Survey.id == survey.id).values(title="Unannounced"))
+    await db_session.commit()
+
+    assert (await public(admin_client, survey.slug)).json()["title"] == "Test Survey"
+
+
+@pytest.mark.asyncio
+async def test_update_is_visible_to_the_next_lookup(admin_client, cache, survey):
+    await public(admin_client, survey.slug)
+
+    patched = await admin_client.patch(f"/api/v1/surveys/{survey.id}", json={"title": "Renamed"})
+
+    assert patched.status_code == 200
+    assert (await public(admin_client, survey.slug)).json()["title"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_delete_is_visible_to_the_next_lookup(admin_client, cache, survey):
+    await public(admin_client, survey.slug)
+
+    deleted = await admin_client.delete(f"/api/v1/surveys/{survey.id}")
+
+    assert deleted.status_code == 204
+    assert (await public(admin_client, survey.slug)).status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("action", "check"),
+    [
+        ("close", lambda response: response.json()["is_open"] is False),
+        ("delete", lambda response: response.status_code == 404),
+    ],
+)
+async def test_bulk_changes_are_visible_to_the_next_lookup(admin_client, cache, survey, action, check):
+    await public(admin_client, survey.slug)
+
+    await admin_client.post(f"/api/v1/surveys/bulk/{action}", json={"ids": [str(survey.id)]})
+
+    assert check(await public(admin_client, survey.slug))
+
+
+@pytest.mark.asyncio
+async def test_bulk_reopen_is_visible_to_the_next_lookup(admin_client, cache, survey):
+    await admin_client.post("/api/v1/surveys/bulk/close", json={"ids": [str(survey.id)]})
+    assert (await public(admin_client, survey.slug)).json()["is_open"] is False
+
+    await admin_client.post("/api/v1/surveys/bulk/reopen", json={"ids": [str(survey.id)]})
+
+    assert (await public(admin_client, survey.slug)).json()["is_open"] is True
+
+
+@pytest.mark.asyncio
+async def test_created_survey_replaces_a_cached_not_found(admin_client, cache):
+    assert (await public(admin_client, "brand-new")).status_code == 404
+    assert survey_cache._surveys["brand-new"] is None
+
+    created = await admin_client.post("/api/v1/surveys/", json={"title": "Brand New", "config": SURVEY_CONFIG})
+
+    assert created.json()["slug"] == "brand-new"
+    assert (await public(admin_client, "brand-new")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_another_workers_change_evicts_through_the_listener(
+    admin_client, db_session, cache, survey
+):
+    await public(admin_client, survey.slug)
+
+    # What another worker's write does: change the row and announce the slug
+    await db_session.execute(update(Survey).where(Survey.id == survey.id).values(title="Elsewhere"))
+    await db_session.execute(slug_changed_statement(survey.slug))
+    await db_session.commit()
+    await wait_until_evicted(survey.slug)
+
+    assert (await public(admin_client, survey.slug)).json()["title"] == "Elsewhere"
+
+
+@pytest.mark.asyncio
+async def test_lost_listener_clears_the_cache(admin_client, db_session, cache, survey):
+    await public(admin_client, survey.slug)
+
+    pid = pg_listener._connection.get_server_pid()
+    await db_session.execute(select(func.pg_terminate_backend(pid)))
+    await db_session.commit()
+    await wait_until_evicted(survey.slug)
+
+    assert not pg_listener.listening
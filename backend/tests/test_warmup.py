@@ -0,0 +1,23 @@
+import pytest
+from sqlalchemy import text
+
+from app.database import engine
+from app.services.warmup import _prime_connection
+
+
+@pytest.mark.asyncio
+async def test_primed_connection_keeps_the_lookups_prepared(db_session):
+    # The module engine's pool may hold connections from another test's loop
+    await engine.dispose()
+    try:
+        await _prime_connection()
+
+        async with engine.connect() as connection:
+            prepared = (
+                await connection.execute(text("SELECT statement FROM pg_prepared_statements"))
+            ).scalars().all()
+    finally:
+        await engine.dispose()
+
+    assert any("FROM users" in statement and "users.id = $1" in statement for statement in prepared)
+    assert any("FROM surveys" in statement and "surveys.slug = $1" in statement for statement in prepared)